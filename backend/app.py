@@ -1,14 +1,28 @@
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, Response, request, jsonify, send_file, stream_with_context
 from flask_cors import CORS
+from werkzeug.datastructures import Headers
+import json
 import logging
 import os
+import queue
+import time
+import unicodedata
+import uuid
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Callable
+from urllib.parse import quote
 
 from config import config
-from scrapers.reddit_client import RedditClient
+from scrapers.reddit_client import RedditClient, RedditMention
 from scrapers.stream_scraper import SteamDBScraper
+from scrapers.http_cache import CachingSession
 from utils.data_processor import DataProcessor
+from utils import aggregation, exporters
+from utils.rate_limiter import rate_limiter
+from utils.job_queue import JobQueue, QueueFullError
+from utils.result_cache import ResultCache
+from utils.mention_store import normalize_game_key
+from utils.stable_ids import stable_hash
 
 # Configure logging
 logging.basicConfig(
@@ -21,15 +35,29 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend
 
+# Seconds of silence before an SSE stream sends a keep-alive comment
+SSE_KEEPALIVE_SECONDS = 15
+
 # Initialize components
 reddit_client = None
 steam_scraper = None
 data_processor = DataProcessor()
+job_queue = JobQueue(max_workers=config.job_workers, max_depth=config.job_queue_depth)
+# Streaming collections hold a worker for as long as the client listens,
+# so they get their own pool and never starve the async jobs
+stream_queue = JobQueue(max_workers=config.stream_workers, max_depth=config.stream_queue_depth, name='stream')
+result_cache = ResultCache(ttl_seconds=config.cache_ttl_seconds, max_entries=config.cache_max_entries)
+# Merged DataFrames behind cached results, by result_id, so exports never round-trip the rows
+merged_results = ResultCache(ttl_seconds=config.cache_ttl_seconds, max_entries=config.cache_max_entries)
 
 def init_clients():
     """Initialize API clients with error handling"""
     global reddit_client, steam_scraper
     
+    # A replaced client's search workers would otherwise never exit
+    if reddit_client is not None:
+        reddit_client.close()
+    
     try:
         reddit_client = RedditClient()
         logger.info("Reddit client initialized successfully")
@@ -56,9 +84,27 @@ def health_check():
         }
     })
 
+@app.route('/api/metrics', methods=['GET'])
+def metrics():
+    """Runtime metrics for the collection pipeline"""
+    return jsonify({
+        'timestamp': datetime.now().isoformat(),
+        'rate_limits': rate_limiter.snapshot(),
+        'reddit_search': reddit_client.search_stats() if reddit_client else None,
+        'steam_http_cache': steam_scraper.session.stats() if steam_scraper and isinstance(steam_scraper.session, CachingSession) else None,
+        'jobs': job_queue.stats(),
+        'streams': stream_queue.stats(),
+        'result_cache': result_cache.stats()
+    })
+
 @app.route('/api/search-game', methods=['POST'])
 def search_game():
-    """Search for a game on SteamDB and return basic info"""
+    """
+    Search for a game on SteamDB and return basic info
+    
+    Pass "suggestions": k to also get the top k fuzzy catalog matches,
+    e.g. for a type-ahead list.
+    """
     try:
         data = request.get_json()
         game_name = data.get('game_name')
@@ -66,6 +112,11 @@ def search_game():
         if not game_name:
             return jsonify({'error': 'game_name is required'}), 400
         
+        try:
+            suggestion_count = min(int(data.get('suggestions', 0)), 25)
+        except (TypeError, ValueError):
+            return jsonify({'error': 'suggestions must be an integer'}), 400
+        
         if not steam_scraper:
             return jsonify({'error': 'Steam scraper not available'}), 503
         
@@ -73,24 +124,244 @@ def search_game():
         
         if result:
             app_id, exact_name = result
-            return jsonify({
+            response = {
                 'found': True,
                 'app_id': app_id,
                 'game_name': exact_name
-            })
+            }
         else:
-            return jsonify({
+            response = {
                 'found': False,
                 'message': f'Game "{game_name}" not found on SteamDB'
-            })
+            }
+        
+        if suggestion_count > 0:
+            response['suggestions'] = steam_scraper.suggest_games(game_name, limit=suggestion_count)
+        
+        return jsonify(response)
     
     except Exception as e:
         logger.error(f"Error in search_game: {e}")
         return jsonify({'error': 'Internal server error'}), 500
 
+class GameNotFoundError(Exception):
+    """Raised when a game name can't be resolved to a Steam app"""
+
+# HTTP status of a failed job by exception class, matching the synchronous routes
+JOB_ERROR_STATUS = {GameNotFoundError.__name__: 404}
+
+def frame_to_records(merged_data) -> List[Dict[str, Any]]:
+    """Convert a merged DataFrame to JSON-ready rows with string dates"""
+    data_list = merged_data.to_dict('records')
+    
+    # Convert date objects to strings for JSON serialization
+    for row in data_list:
+        if hasattr(row['date'], 'strftime'):
+            row['date'] = row['date'].strftime('%Y-%m-%d')
+    
+    return data_list
+
+def run_collection(
+    game_name: str,
+    app_id: str = None,
+    days: int = 30,
+    progress: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    result_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Collect, merge and summarize Steam and Reddit data for a game
+    
+    Args:
+        game_name: Name of the game
+        app_id: Optional Steam App ID, searched for if not provided
+        days: Number of days to collect
+        progress: Optional callback receiving (event, payload) as each stage
+            finishes; 'stage' events carry timings and row counts, 'rows'
+            events carry the partial merged daily rows
+        result_id: ID the merged DataFrame is kept under in merged_results
+            for exports (default: a random one)
+        
+    Returns:
+        The collect-data response payload
+        
+    Raises:
+        GameNotFoundError: If no app_id was given and the search found nothing
+    """
+    started = time.perf_counter()
+    stage_started = started
+    
+    def report_stage(stage: str, **details):
+        nonlocal stage_started
+        if progress:
+            now = time.perf_counter()
+            progress('stage', {
+                'stage': stage,
+                'elapsed': round(now - started, 3),
+                'stage_seconds': round(now - stage_started, 3),
+                **details
+            })
+            stage_started = now
+    
+    # Partial rows are built up as results arrive: followers once, then
+    # each batch of new mentions added to the running daily totals
+    partial_followers = aggregation.daily_follower_counts([])
+    partial_mentions = aggregation.daily_mention_totals([])
+    
+    def report_rows(new_mentions):
+        nonlocal partial_mentions
+        if progress:
+            partial_mentions = aggregation.add_mention_totals(partial_mentions, new_mentions)
+            partial = aggregation.merge_daily(partial_followers, partial_mentions)
+            progress('rows', {'elapsed': round(time.perf_counter() - started, 3), 'data': frame_to_records(partial)})
+    
+    # If no app_id provided, search for it
+    if not app_id and steam_scraper:
+        search_result = steam_scraper.search_game_by_name(game_name)
+        if search_result:
+            app_id, exact_game_name = search_result
+            game_name = exact_game_name
+            report_stage('search_game_by_name', app_id=app_id, game_name=game_name)
+        else:
+            raise GameNotFoundError(f'Game "{game_name}" not found on SteamDB')
+    
+    # Collect Steam data
+    steam_data = []
+    if steam_scraper and app_id:
+        try:
+            steam_data = steam_scraper.get_follower_history(app_id, days)
+            logger.info(f"Collected {len(steam_data)} Steam data points")
+        except Exception as e:
+            logger.error(f"Error collecting Steam data: {e}")
+        report_stage('get_follower_history', rows=len(steam_data))
+        partial_followers = aggregation.daily_follower_counts(steam_data)
+        report_rows([])
+    
+    mentions_so_far = 0
+    
+    def on_query_done(stats: Dict[str, Any], new_mentions: List[RedditMention]):
+        nonlocal mentions_so_far
+        mentions_so_far += len(new_mentions)
+        report_stage(
+            'search_game_mentions',
+            subreddit=stats['subreddit'],
+            query=stats['query'],
+            rows=stats['posts_in_window'],
+            query_seconds=stats['seconds'],
+            mentions_so_far=mentions_so_far
+        )
+        report_rows(new_mentions)
+    
+    # Collect Reddit data
+    reddit_mentions = []
+    if reddit_client:
+        try:
+            reddit_mentions = reddit_client.search_game_mentions(
+                game_name, days, on_query_done=on_query_done if progress else None
+            )
+            logger.info(f"Collected {len(reddit_mentions)} Reddit mentions")
+            
+            # If no mentions found and Reddit auth failed, use simulated data
+            if len(reddit_mentions) == 0:
+                logger.info("No Reddit mentions found, generating simulated data for demonstration")
+                
+        except Exception as e:
+            logger.error(f"Error collecting Reddit data: {e}")
+            logger.info("Falling back to simulated Reddit data for demonstration")
+            reddit_mentions = reddit_client.generate_simulated_mentions(game_name, days)
+    
+    # Process and merge data
+    merged_data = data_processor.merge_steam_reddit_data(steam_data, reddit_mentions)
+    
+    # Generate summary stats
+    stats = data_processor.generate_summary_stats(merged_data)
+    
+    # Save raw data
+    data_processor.save_raw_data(steam_data, reddit_mentions, app_id)
+    
+    # Keep the merged frame for exports
+    result_id = result_id or uuid.uuid4().hex
+    merged_results.put(result_id, merged_data)
+    
+    # Convert DataFrame to list of dictionaries for JSON response
+    data_list = frame_to_records(merged_data)
+    report_stage('merge', rows=len(data_list))
+    
+    return {
+        'success': True,
+        'game_name': game_name,
+        'app_id': app_id,
+        'result_id': result_id,
+        'data': data_list,
+        'stats': stats,
+        'collected': {
+            'steam_points': len(steam_data),
+            'reddit_mentions': len(reddit_mentions)
+        }
+    }
+
+def cached_collection(
+    game_name: str,
+    app_id: str = None,
+    days: int = 30,
+    progress: Optional[Callable[[str, Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """
+    run_collection behind the result cache
+    
+    Results are keyed by (normalized game name, app_id, days). Identical
+    requests arriving while a collection is running wait for it instead of
+    starting their own; only that first request sees progress events.
+    The result_id is derived from the key, so repeating a request after
+    its result expired gives the same ID.
+    """
+    key = (normalize_game_key(game_name), str(app_id) if app_id else None, int(days))
+    result_id = f"{stable_hash('result', *key):016x}"
+    result = result_cache.get_or_compute(key, lambda: run_collection(game_name, app_id, days, progress, result_id))
+    
+    # Touch the merged frame too, so it isn't evicted ahead of its payload
+    merged_results.get(result_id)
+    return result
+
+def run_analysis(game_name: str, app_id: str = None, days: int = 30, export_csv: bool = True) -> Dict[str, Any]:
+    """Complete analysis workflow: collection plus optional CSV export"""
+    collect_result = cached_collection(game_name, app_id, days)
+    
+    result = {
+        'success': True,
+        'analysis': collect_result
+    }
+    
+    # Export CSV if requested, straight from the stored frame
+    merged = merged_results.get(collect_result['result_id'])
+    if export_csv and merged is not None and not merged.empty:
+        csv_path = data_processor.export_to_csv(
+            merged,
+            f"{game_name.lower().replace(' ', '_')}_analysis.csv"
+        )
+        result['csv_export'] = {
+            'path': csv_path,
+            'download_url': f'/api/download-csv/{os.path.basename(csv_path)}',
+            'stream_url': f"/api/export-csv/{collect_result['result_id']}"
+        }
+    
+    return result
+
+def submit_job(kind: str, params: Dict[str, Any], fn):
+    """Queue a job and return the 202 response pointing at its status"""
+    try:
+        job = job_queue.submit(kind, params, fn)
+    except QueueFullError as e:
+        return jsonify({'error': str(e)}), 429
+    
+    return jsonify({
+        **job.to_dict(),
+        'status_url': f'/api/jobs/{job.id}',
+        'result_url': f'/api/jobs/{job.id}/result'
+    }), 202
+
 @app.route('/api/collect-data', methods=['POST'])
 def collect_data():
-    """Collect data for a specific game"""
+    """Collect data for a specific game (pass "async": true to run it as a job)"""
     try:
         data = request.get_json()
         game_name = data.get('game_name')
@@ -100,106 +371,224 @@ def collect_data():
         if not game_name:
             return jsonify({'error': 'game_name is required'}), 400
         
-        # If no app_id provided, search for it
-        if not app_id and steam_scraper:
-            search_result = steam_scraper.search_game_by_name(game_name)
-            if search_result:
-                app_id, exact_game_name = search_result
-                game_name = exact_game_name
-            else:
-                return jsonify({'error': f'Game "{game_name}" not found on SteamDB'}), 404
+        params = {'game_name': game_name, 'app_id': app_id, 'days': days}
+        if data.get('async'):
+            return submit_job('collect-data', params, cached_collection)
         
-        # Collect Steam data
-        steam_data = []
-        if steam_scraper and app_id:
-            try:
-                steam_data = steam_scraper.get_follower_history(app_id, days)
-                logger.info(f"Collected {len(steam_data)} Steam data points")
-            except Exception as e:
-                logger.error(f"Error collecting Steam data: {e}")
-        
-        # Collect Reddit data
-        reddit_mentions = []
-        if reddit_client:
-            try:
-                reddit_mentions = reddit_client.search_game_mentions(game_name, days)
-                logger.info(f"Collected {len(reddit_mentions)} Reddit mentions")
-                
-                # If no mentions found and Reddit auth failed, use simulated data
-                if len(reddit_mentions) == 0:
-                    logger.info("No Reddit mentions found, generating simulated data for demonstration")
-                    
-            except Exception as e:
-                logger.error(f"Error collecting Reddit data: {e}")
-                logger.info("Falling back to simulated Reddit data for demonstration")
-                reddit_mentions = reddit_client.generate_simulated_mentions(game_name, days)
-        
-        # Process and merge data
-        merged_data = data_processor.merge_steam_reddit_data(steam_data, reddit_mentions)
-        
-        # Generate summary stats
-        stats = data_processor.generate_summary_stats(merged_data)
-        
-        # Save raw data
-        data_processor.save_raw_data(steam_data, reddit_mentions)
-        
-        # Convert DataFrame to list of dictionaries for JSON response
-        data_list = merged_data.to_dict('records')
-        
-        # Convert date objects to strings for JSON serialization
-        for row in data_list:
-            if hasattr(row['date'], 'strftime'):
-                row['date'] = row['date'].strftime('%Y-%m-%d')
-        
-        return jsonify({
-            'success': True,
-            'game_name': game_name,
-            'app_id': app_id,
-            'data': data_list,
-            'stats': stats,
-            'collected': {
-                'steam_points': len(steam_data),
-                'reddit_mentions': len(reddit_mentions)
-            }
-        })
+        return jsonify(cached_collection(**params))
     
+    except GameNotFoundError as e:
+        return jsonify({'error': str(e)}), 404
     except Exception as e:
         logger.error(f"Error in collect_data: {e}")
         return jsonify({'error': 'Internal server error'}), 500
 
+@app.route('/api/collect-data/stream', methods=['GET'])
+def collect_data_stream():
+    """
+    Collect data for a game, streaming progress as Server-Sent Events
+    
+    Query parameters match /api/collect-data (game_name, app_id, days).
+    Emits 'stage' and partial 'rows' events while collecting, then one
+    'complete' event with the normal response body, or an 'error' event.
+    
+    Collections run on their own pool (STREAM_WORKERS), not the job
+    queue; when STREAM_QUEUE_DEPTH streams are open, new ones get a 429.
+    An identical request arriving while a collection is already running
+    waits for it (see cached_collection), so that waiter only receives
+    the 'complete' (or 'error') event, with no 'stage' or 'rows' events.
+    """
+    game_name = request.args.get('game_name')
+    app_id = request.args.get('app_id')
+    days = request.args.get('days', 30, type=int)
+    
+    if not game_name:
+        return jsonify({'error': 'game_name is required'}), 400
+    
+    events = queue.Queue()
+    
+    def collect_with_events(**params):
+        try:
+            result = cached_collection(**params, progress=lambda event, payload: events.put((event, payload)))
+            events.put(('complete', result))
+            return result
+        except GameNotFoundError as e:
+            events.put(('error', {'error': str(e), 'status': 404}))
+            raise
+        except Exception as e:
+            logger.error(f"Error in collect_data_stream: {e}")
+            events.put(('error', {'error': 'Internal server error', 'status': 500}))
+            raise
+        finally:
+            events.put(None)
+    
+    try:
+        stream_queue.submit('collect-data-stream', {'game_name': game_name, 'app_id': app_id, 'days': days}, collect_with_events)
+    except QueueFullError as e:
+        return jsonify({'error': str(e)}), 429
+    
+    def stream():
+        while True:
+            try:
+                item = events.get(timeout=SSE_KEEPALIVE_SECONDS)
+            except queue.Empty:
+                yield ": keep-alive\n\n"
+                continue
+            
+            if item is None:
+                return
+            
+            event, payload = item
+            yield f"event: {event}\ndata: {json.dumps(payload, default=str)}\n\n"
+    
+    return Response(
+        stream_with_context(stream()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """Status and timing of a background job"""
+    job = job_queue.get(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    return jsonify(job.to_dict())
+
+@app.route('/api/jobs/<job_id>/result', methods=['GET'])
+def job_result(job_id):
+    """Result of a finished background job"""
+    job = job_queue.get(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    if not job.done:
+        return jsonify(job.to_dict()), 202
+    
+    if job.status == 'failed':
+        return jsonify({**job.to_dict(), 'error': job.error}), JOB_ERROR_STATUS.get(job.error_type, 500)
+    
+    return jsonify(job.result)
+
 @app.route('/api/export-csv', methods=['POST'])
 def export_csv():
-    """Export data to CSV and return download link"""
+    """
+    Export data to a file and return download link
+
+    Pass the "result_id" of a collect-data response to export the stored
+    result; posting the rows back as "data" still works. "format" picks
+    csv (default), csv.gz, parquet, arrow or ndjson, otherwise the
+    filename's extension decides; "gzip": true is short for csv.gz. With
+    "stream": true the file is written straight into the response in
+    chunks instead; exports over EXPORT_SPOOL_ROWS rows are written to
+    disk first and sent from there, so large downloads can resume.
+    """
     try:
         data = request.get_json()
         
-        # Expect data in the format from collect_data endpoint
-        data_list = data.get('data', [])
         filename = data.get('filename')
+        fmt = requested_format(filename, data.get('format'), bool(data.get('gzip', False)))
         
-        if not data_list:
-            return jsonify({'error': 'No data provided'}), 400
+        if data.get('result_id'):
+            df = merged_results.get(data['result_id'])
+            if df is None:
+                return jsonify({'error': 'Result not found or expired, collect the data again'}), 404
+        else:
+            # Expect data in the format from collect_data endpoint
+            data_list = data.get('data', [])
+            if not data_list:
+                return jsonify({'error': 'No data provided'}), 400
+            
+            # Convert list back to DataFrame
+            import pandas as pd
+            df = pd.DataFrame(data_list)
         
-        # Convert list back to DataFrame
-        import pandas as pd
-        df = pd.DataFrame(data_list)
+        if data.get('stream'):
+            return stream_export(df, filename, fmt)
         
-        # Export to CSV
-        csv_path = data_processor.export_to_csv(df, filename)
+        # Export to file
+        path = data_processor.export(df, filename, fmt)
         
         return jsonify({
             'success': True,
-            'csv_path': csv_path,
-            'download_url': f'/api/download-csv/{os.path.basename(csv_path)}'
+            'format': fmt,
+            'csv_path': path,
+            'download_url': f'/api/download-csv/{os.path.basename(path)}'
         })
     
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error in export_csv: {e}")
         return jsonify({'error': 'Internal server error'}), 500
 
+@app.route('/api/export/<result_id>', methods=['GET'])
+@app.route('/api/export-csv/<result_id>', methods=['GET'])
+def export_result(result_id):
+    """
+    Download a stored result, streamed from the server-side frame
+
+    Query parameters: filename (optional), format (csv, csv.gz, parquet,
+    arrow or ndjson; default from the filename, else csv), gzip
+    (true/false, short for csv.gz).
+    """
+    try:
+        df = merged_results.get(result_id)
+        if df is None:
+            return jsonify({'error': 'Result not found or expired, collect the data again'}), 404
+        
+        filename = request.args.get('filename')
+        gzip = request.args.get('gzip', 'false').lower() == 'true'
+        return stream_export(df, filename, requested_format(filename, request.args.get('format'), gzip))
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error in export_result: {e}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+def requested_format(filename: Optional[str], fmt: Optional[str], gzip: bool) -> str:
+    """Export format from a request's format/gzip options and filename (ValueError if unknown)"""
+    if not fmt and gzip:
+        fmt = 'csv.gz'
+    return exporters.format_for(filename, fmt)
+
+def stream_export(df, filename: Optional[str], fmt: str) -> Response:
+    """Send merged data as an attachment without building the file in memory"""
+    if len(df) > config.export_spool_rows:
+        path = data_processor.export(df, filename, fmt)
+        return send_file(
+            path,
+            as_attachment=True,
+            download_name=os.path.basename(path),
+            mimetype=exporters.mimetype_for(path)
+        )
+    
+    download_name = data_processor.export_filename(filename, fmt)
+    
+    # Same Content-Disposition as send_file: an ASCII filename, plus
+    # filename* (RFC 5987) when the name has other characters
+    headers = Headers()
+    try:
+        download_name.encode('ascii')
+        headers.add('Content-Disposition', 'attachment', filename=download_name)
+    except UnicodeEncodeError:
+        ascii_name = unicodedata.normalize('NFKD', download_name).encode('ascii', 'ignore').decode('ascii')
+        headers.add(
+            'Content-Disposition', 'attachment',
+            filename=ascii_name, **{'filename*': f"UTF-8''{quote(download_name, safe='')}"}
+        )
+    
+    return Response(
+        stream_with_context(data_processor.iter_export(df, fmt)),
+        mimetype=exporters.mimetype_for(download_name),
+        headers=headers
+    )
+
 @app.route('/api/download-csv/<filename>', methods=['GET'])
 def download_csv(filename):
-    """Download CSV file"""
+    """Download an exported file"""
     try:
         file_path = data_processor.data_dir / filename
         
@@ -210,7 +599,7 @@ def download_csv(filename):
             file_path,
             as_attachment=True,
             download_name=filename,
-            mimetype='text/csv'
+            mimetype=exporters.mimetype_for(filename)
         )
     
     except Exception as e:
@@ -219,7 +608,7 @@ def download_csv(filename):
 
 @app.route('/api/analyze-game', methods=['POST'])
 def analyze_game():
-    """Complete analysis workflow for a game"""
+    """Complete analysis workflow for a game (pass "async": true to run it as a job)"""
     try:
         data = request.get_json()
         game_name = data.get('game_name')
@@ -229,33 +618,19 @@ def analyze_game():
         if not game_name:
             return jsonify({'error': 'game_name is required'}), 400
         
-        # Use the collect_data logic
-        collect_response = collect_data()
-        
-        if collect_response.status_code != 200:
-            return collect_response
-        
-        collect_result = collect_response.get_json()
-        
-        result = {
-            'success': True,
-            'analysis': collect_result
+        params = {
+            'game_name': game_name,
+            'app_id': data.get('app_id'),
+            'days': days,
+            'export_csv': export_csv_flag
         }
+        if data.get('async'):
+            return submit_job('analyze-game', params, run_analysis)
         
-        import pandas as pd
-        # Export CSV if requested
-        if export_csv_flag and collect_result.get('data'):
-            csv_path = data_processor.export_to_csv(
-                pd.DataFrame(collect_result['data']),
-                f"{game_name.lower().replace(' ', '_')}_analysis.csv"
-            )
-            result['csv_export'] = {
-                'path': csv_path,
-                'download_url': f'/api/download-csv/{os.path.basename(csv_path)}'
-            }
-        
-        return jsonify(result)
+        return jsonify(run_analysis(**params))
     
+    except GameNotFoundError as e:
+        return jsonify({'error': str(e)}), 404
     except Exception as e:
         logger.error(f"Error in analyze_game: {e}")
         return jsonify({'error': 'Internal server error'}), 500
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark: local Steam app catalog lookups
+
+Builds a catalog from a Steam app list dump (or a generated one of
+--apps titles) in a temporary directory and reports the median latency
+of exact, prefix, token and fuzzy lookups over a set of queries with
+typos, missing punctuation and reordered words, then of app_id -> name
+lookups one at a time and in bulk.
+
+Usage:
+    python benchmarks/bench_app_catalog.py [--app-list steam_app_list.json] [--apps 150000] [--repeat 50]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.app_catalog import AppCatalog, load_app_list
+
+WORDS = (
+    "dark souls legend quest war space star galaxy dragon knight city craft "
+    "simulator tycoon hunter shadow empire age kingdom battle zero racing "
+    "dungeon tower defense farm story island rogue world lost last night "
+    "blood iron storm fire ice soul witch ghost mech pixel super ultra"
+).split()
+
+KNOWN = [
+    (1086940, "Baldur's Gate 3"), (292030, "The Witcher 3: Wild Hunt"),
+    (1245620, "ELDEN RING"), (730, "Counter-Strike 2"), (570, "Dota 2"),
+    (271590, "Grand Theft Auto V"), (1174180, "Red Dead Redemption 2"),
+]
+
+QUERIES = [
+    "Baldur's Gate 3", "baldurs gate 3", "Baldurs Gat 3", "witcher 3 wild hunt",
+    "eldenring", "Counter Strike 2", "grand theft auto 5", "red ded redemption 2",
+]
+
+
+def generated_apps(count: int):
+    rng = random.Random(0)
+    apps = list(KNOWN)
+    for app_id in range(10, count - len(KNOWN) + 10):
+        name = " ".join(rng.choice(WORDS).title() for _ in range(rng.randint(1, 4)))
+        if rng.random() < 0.3:
+            name += f" {rng.randint(2, 5)}"
+        apps.append((app_id * 10, name))
+    return apps
+
+
+def median_us(fn, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return result, statistics.median(timings) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--app-list", help="Steam app list JSON (default: generated titles)")
+    parser.add_argument("--apps", type=int, default=150000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    apps = load_app_list(Path(args.app_list)) if args.app_list else generated_apps(args.apps)
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        catalog = AppCatalog.build(apps, Path(directory))
+        print(f"built {len(catalog)} apps in {time.perf_counter() - start:.2f}s\n")
+
+        print(f"{'query':24} {'method':8} {'median us':>10}  best match")
+        for query in QUERIES:
+            for method in ("lookup", "prefix", "tokens", "fuzzy"):
+                fn = {
+                    "lookup": lambda: catalog.lookup(query),
+                    "prefix": lambda: catalog.prefix(query, limit=5),
+                    "tokens": lambda: catalog.search_tokens(query, limit=5),
+                    "fuzzy": lambda: catalog.fuzzy(query, limit=5),
+                }[method]
+                result, micros = median_us(fn, args.repeat)
+                best = result[0] if isinstance(result, list) and result else result
+                print(f"{query:24} {method:8} {micros:>10.1f}  {best}")
+
+        app_ids = [str(int(app_id)) for app_id in catalog.app_ids[::max(1, len(catalog) // 1000)]]
+        _, single = median_us(lambda: catalog.name_for(app_ids[0]), args.repeat)
+        _, bulk = median_us(lambda: catalog.names_for(app_ids), args.repeat)
+        print(f"\nname_for: {single:.1f} us, names_for({len(app_ids)} ids): {bulk:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
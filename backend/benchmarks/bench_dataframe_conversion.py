@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark: record -> DataFrame conversion
+
+Times the old list-of-dicts converters against the column-building ones
+in utils.aggregation for mentions (as records and as a MentionBatch) and
+follower points (as records and as a FollowerSeries).
+
+Usage:
+    python benchmarks/bench_dataframe_conversion.py [--rows 10000 100000 1000000] [--repeat 3]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scrapers.models import RedditMention, SteamFollowerData, MentionBatch
+from utils import aggregation
+from benchmarks.bench_model_memory import mention_records, follower_records, follower_series
+
+
+def legacy_mentions_to_dataframe(mentions):
+    """The per-row dict converter this benchmark replaces"""
+    data = []
+    for mention in mentions:
+        data.append({
+            'id': mention.id,
+            'title': mention.title,
+            'subreddit': mention.subreddit,
+            'author': mention.author,
+            'created_utc': mention.created_utc,
+            'date': mention.created_utc.date(),
+            'score': mention.score,
+            'num_comments': mention.num_comments,
+            'url': mention.url
+        })
+    return pd.DataFrame(data)
+
+
+def legacy_follower_data_to_dataframe(data):
+    df_data = []
+    for item in data:
+        df_data.append({
+            'app_id': item.app_id,
+            'game_name': item.game_name,
+            'date': item.date.date(),
+            'follower_count': item.follower_count,
+            'source': item.source
+        })
+    return pd.DataFrame(df_data)
+
+
+def median_ms(fn, value, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(value)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>9} {'input':22} {'legacy ms':>10} {'new ms':>10} {'speedup':>8}")
+    for rows in args.rows:
+        mentions = mention_records(RedditMention, rows)
+        batch = MentionBatch.from_mentions(mentions)
+        # Hourly points, so a million of them stay within datetime's range
+        points = follower_records(SteamFollowerData, rows, step=timedelta(hours=1))
+        series = follower_series(rows, step=timedelta(hours=1))
+
+        cases = [
+            ("mention records", legacy_mentions_to_dataframe, mentions, aggregation.mentions_to_dataframe, mentions),
+            ("MentionBatch", legacy_mentions_to_dataframe, mentions, aggregation.mentions_to_dataframe, batch),
+            ("follower records", legacy_follower_data_to_dataframe, points, aggregation.follower_data_to_dataframe, points),
+            ("FollowerSeries", legacy_follower_data_to_dataframe, points, aggregation.follower_data_to_dataframe, series),
+        ]
+        for name, legacy, legacy_input, new, new_input in cases:
+            old_ms = median_ms(legacy, legacy_input, args.repeat)
+            new_ms = median_ms(new, new_input, args.repeat)
+            print(f"{rows:>9} {name:22} {old_ms:>10.1f} {new_ms:>10.1f} {old_ms / new_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark: export formats
+
+Writes the same merged daily table (a year of days per game, repeated
+up to --rows) in every export format and reports the write time, the
+file size and how long pandas takes to read it back.
+
+Usage:
+    python benchmarks/bench_export_formats.py [--rows 100000 1000000] [--chunk-rows 10000] [--repeat 3]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.exporters import EXPORT_FORMATS, iter_export
+
+READERS = {
+    'csv': lambda path: pd.read_csv(path, parse_dates=['date']),
+    'csv.gz': lambda path: pd.read_csv(path, parse_dates=['date']),
+    'parquet': pd.read_parquet,
+    'arrow': pd.read_feather,
+    'ndjson': lambda path: pd.read_json(path, lines=True),
+}
+
+
+def merged_table(rows: int) -> pd.DataFrame:
+    """Daily rows for rows // 365 games, shaped like merge_steam_reddit_data output"""
+    rng = np.random.default_rng(0)
+    day = np.arange(rows) % 365
+    game = np.arange(rows) // 365
+    return pd.DataFrame({
+        'date': (np.datetime64('2024-01-01') + day).astype(object),
+        'steam_followers_count': 10_000 * (game % 50 + 1) + day * rng.integers(0, 40, rows),
+        'mentions_in_social_media': rng.poisson(3, rows),
+    })
+
+
+def median_seconds(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument("--chunk-rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{'rows':>9} {'format':8} {'write s':>8} {'MiB':>8} {'read s':>8}")
+        for rows in args.rows:
+            data = merged_table(rows)
+            for fmt, (extension, _) in EXPORT_FORMATS.items():
+                path = Path(directory) / f"export{extension}"
+
+                def write():
+                    with open(path, 'wb') as f:
+                        for piece in iter_export(data, fmt, args.chunk_rows):
+                            f.write(piece)
+
+                write_s = median_seconds(write, args.repeat)
+                read_s = median_seconds(lambda: READERS[fmt](path), args.repeat)
+                size = path.stat().st_size / 2**20
+                print(f"{rows:>9} {fmt:8} {write_s:>8.2f} {size:>8.1f} {read_s:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark: SteamDB HTML parser backends
+
+Parses each fixture page with every backend and reports the median parse
+time and the tracemalloc peak. Pages named search_*.html are parsed as
+search results, app_*.html as app pages. tracemalloc only sees the
+Python heap, so lxml's libxml2 tree shows up as a few KiB; the number
+is a lower bound for that backend.
+
+Usage:
+    python benchmarks/bench_html_parsers.py [--fixtures DIR] [--repeat 20]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scrapers.steamdb_parsers import PARSERS, LXML_AVAILABLE
+from benchmarks.steamdb_fixtures import generated_fixtures
+
+
+def load_fixtures(directory: str):
+    if not directory:
+        return generated_fixtures()
+    return {path.name: path.read_bytes() for path in sorted(Path(directory).glob("*.html"))}
+
+
+def parse_method(parser, page_name: str):
+    return parser.parse_search_result if page_name.startswith("search") else parser.parse_follower_count
+
+
+def measure(fn, content: bytes, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(content)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, statistics.median(timings), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fixtures", help="Directory of saved SteamDB pages (default: generated pages)")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    backends = [name for name in PARSERS if name != "lxml" or LXML_AVAILABLE]
+    fixtures = load_fixtures(args.fixtures)
+
+    print(f"{'page':28} {'size':>8} {'backend':8} {'median ms':>10} {'peak KiB':>10}  result")
+    for page_name, content in fixtures.items():
+        for name in backends:
+            result, seconds, peak = measure(parse_method(PARSERS[name](), page_name), content, args.repeat)
+            print(f"{page_name:28} {len(content) // 1024:>6}KB {name:8} {seconds * 1000:>10.2f} {peak / 1024:>10.0f}  {result}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory held by mention and follower records
+
+Builds the same generated mentions and follower points as the old
+dict-backed dataclasses, the slotted records and the columnar
+MentionBatch / FollowerSeries, and reports the tracemalloc size of each
+form plus the time mentions_to_dataframe takes to wrap it.
+
+Usage:
+    python benchmarks/bench_model_memory.py [--mentions 100000] [--days 1825]
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta, UTC
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scrapers.models import RedditMention, SteamFollowerData, MentionBatch, FollowerSeries
+from utils import aggregation
+
+SUBREDDITS = ["gaming", "Steam", "pcgaming", "GameDeals", "tipofmyjoystick", "Games"]
+
+
+@dataclass
+class LegacyRedditMention:
+    """The pre-slots RedditMention: one __dict__ per instance"""
+    id: str
+    title: str
+    subreddit: str
+    author: str
+    created_utc: datetime
+    score: int
+    num_comments: int
+    url: str
+
+
+@dataclass
+class LegacySteamFollowerData:
+    """The pre-slots SteamFollowerData"""
+    app_id: str
+    game_name: str
+    date: datetime
+    follower_count: int
+    source: str
+
+
+def mention_rows(count: int):
+    now = datetime.now(UTC).timestamp()
+    for i in range(count):
+        yield (
+            f"t3_{i:07x}",
+            f"Post number {i} about the game",
+            SUBREDDITS[i % len(SUBREDDITS)],
+            f"user_{i % 5000}",
+            float(int(now) - i * 60),
+            i % 500,
+            i % 40,
+            f"https://reddit.com/r/{SUBREDDITS[i % len(SUBREDDITS)]}/comments/{i:07x}",
+        )
+
+
+def mention_records(cls, count: int):
+    return [
+        cls(
+            id=row[0], title=row[1], subreddit=sys.intern(row[2]), author=sys.intern(row[3]),
+            created_utc=datetime.fromtimestamp(row[4], UTC), score=row[5], num_comments=row[6], url=row[7]
+        )
+        for row in mention_rows(count)
+    ]
+
+
+def follower_records(cls, days: int, step: timedelta = timedelta(days=1)):
+    now = datetime.now()
+    return [
+        cls(app_id="1091500", game_name="Cyberpunk 2077", date=now - i * step,
+            follower_count=1_000_000 - i, source="simulated")
+        for i in range(days)
+    ]
+
+
+def follower_series(days: int, step: timedelta = timedelta(days=1)):
+    now = np.datetime64(datetime.now(), "us")
+    return FollowerSeries(
+        app_id="1091500",
+        game_name="Cyberpunk 2077",
+        dates=now - np.arange(days)[::-1] * np.timedelta64(step),
+        follower_counts=1_000_000 - np.arange(days, dtype=np.int64)[::-1],
+        sources=np.full(days, "simulated"),
+    )
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--mentions", type=int, default=100000)
+    parser.add_argument("--days", type=int, default=1825)
+    args = parser.parse_args()
+
+    forms = [
+        ("mentions: dataclass", lambda: mention_records(LegacyRedditMention, args.mentions)),
+        ("mentions: slotted", lambda: mention_records(RedditMention, args.mentions)),
+        ("mentions: MentionBatch", lambda: MentionBatch.from_rows(list(mention_rows(args.mentions)))),
+        ("followers: dataclass", lambda: follower_records(LegacySteamFollowerData, args.days)),
+        ("followers: slotted", lambda: follower_records(SteamFollowerData, args.days)),
+        ("followers: FollowerSeries", lambda: follower_series(args.days)),
+    ]
+
+    print(f"{'form':28} {'MiB':>8} {'bytes/row':>10} {'to DataFrame ms':>16}")
+    for name, build in forms:
+        value, size = measure(build)
+        to_frame = aggregation.mentions_to_dataframe if name.startswith("mentions") else aggregation.follower_data_to_dataframe
+        start = time.perf_counter()
+        to_frame(value)
+        millis = (time.perf_counter() - start) * 1000
+        print(f"{name:28} {size / 2**20:>8.1f} {size / len(value):>10.0f} {millis:>16.1f}")
+        del value
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sequential vs concurrent RedditClient.search_game_mentions
+
+Runs the subreddit/query search matrix against a local fake Reddit server
+and compares the old one-by-one loop (with its fixed 1 s sleep, reading
+every page) to the concurrent worker pool that stops at the cutoff date.
+
+Usage:
+    python benchmarks/bench_reddit_search.py [--latency 0.2] [--workers 6] [--posts 1000 --days 7]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Dummy credentials so config loads; nothing talks to the real Reddit API
+for name in ("REDDIT_CLIENT_ID", "REDDIT_CLIENT_SECRET", "REDDIT_USERNAME", "REDDIT_PASSWORD"):
+    os.environ.setdefault(name, "benchmark")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import config
+from scrapers.reddit_client import RedditClient
+from benchmarks.fake_reddit import FakeRedditServer
+
+SUBREDDITS = ["all", "gaming", "Steam", "pcgaming", "GameDeals", "tipofmyjoystick"]
+
+
+def sequential_search(client: RedditClient, game_name: str) -> int:
+    """The pre-concurrency loop: one search at a time, 1 s sleep after each"""
+    seen = set()
+    for subreddit_name in SUBREDDITS:
+        subreddit = client.reddit.subreddit(subreddit_name)
+        for query in [game_name, f'"{game_name}"', game_name.replace(" ", "")]:
+            for submission in subreddit.search(query, limit=1000, sort="new"):
+                seen.add(submission.id)
+            time.sleep(1)
+    return len(seen)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.2, help="Fake server latency per request (s)")
+    parser.add_argument("--workers", type=int, default=config.reddit.max_workers)
+    parser.add_argument("--posts", type=int, default=25, help="Posts per query (1 per hour, newest first)")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--game", default="Elden Ring")
+    args = parser.parse_args()
+
+    config.reddit.max_workers = args.workers
+
+    with FakeRedditServer(latency=args.latency, posts_per_query=args.posts) as server:
+        client = RedditClient(**server.praw_overrides())
+
+        found, elapsed = timed(lambda: sequential_search(client, args.game))
+        print(f"sequential : {elapsed:6.2f}s  {found} posts, {server.request_count} API requests")
+
+        server.request_count = 0
+        mentions, elapsed = timed(lambda: client.search_game_mentions(args.game, days=args.days))
+        totals = client.search_stats()['totals']
+        print(f"concurrent : {elapsed:6.2f}s  {len(mentions)} posts in window, {server.request_count} API requests "
+              f"({args.workers} workers, {config.reddit.requests_per_minute} req/min budget)")
+        print(f"pages      : {totals['pages_fetched']} fetched, {totals['pages_needed']} needed, "
+              f"{totals['early_stops']}/{totals['searches']} searches stopped at the cutoff")
+
+
+if __name__ == "__main__":
+    main()
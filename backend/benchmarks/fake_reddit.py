@@ -0,0 +1,124 @@
+"""
+Minimal local stand-in for the Reddit OAuth API used by the benchmarks.
+
+Serves the token endpoint and /r/<subreddit>/search listings with a fixed
+per-request latency, so RedditClient can be pointed at it through
+oauth_url/reddit_url without touching the real API.
+"""
+
+import json
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+
+class FakeRedditServer:
+    """Threaded HTTP server answering PRAW token and search requests"""
+
+    def __init__(self, latency: float = 0.2, posts_per_query: int = 25, post_interval: float = 3600):
+        self.latency = latency
+        self.posts_per_query = posts_per_query
+        self.post_interval = post_interval  # Seconds between consecutive posts
+        self.request_count = 0
+        self.window_budget = 600  # Reddit: 600 requests per 10 minute window
+        self._started = time.time()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def praw_overrides(self) -> dict:
+        """Keyword arguments that point RedditClient at this server"""
+        return {
+            'oauth_url': self.url,
+            # Same server under another host name, like www vs oauth on Reddit
+            'reddit_url': self.url.replace('127.0.0.1', 'localhost'),
+            'check_for_updates': False,
+        }
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _listing(self, subreddit: str, query: str, after: str = None, limit: int = 100) -> dict:
+        """One page of a newest-first search listing, paginated like Reddit's"""
+        now = time.time()
+        # Query variants of the same title return overlapping post IDs
+        topic = query.strip('"').replace(' ', '').lower()
+        start = int(after.split('_')[-1]) + 1 if after else 0
+        end = min(self.posts_per_query, start + min(limit, 100))
+        children = []
+        for i in range(start, end):
+            post_id = f"{zlib.crc32(f'{topic}-{i}'.encode()):x}"
+            children.append({
+                'kind': 't3',
+                'data': {
+                    'id': post_id,
+                    'name': f"t3_{post_id}",
+                    'title': f"{query} post {i}",
+                    'subreddit': subreddit,
+                    'author': f"user{i}",
+                    'created_utc': now - i * self.post_interval,
+                    'score': i,
+                    'num_comments': i * 2,
+                    'url': f"https://reddit.example/{post_id}",
+                },
+            })
+        # Cursor encodes the position so the next page can resume from it
+        next_after = f"t3_pos_{end - 1}" if end < self.posts_per_query else None
+        return {'kind': 'Listing', 'data': {'after': next_after, 'children': children}}
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send_json(self, payload: dict):
+                body = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                elapsed = time.time() - server._started
+                self.send_header('X-Ratelimit-Used', str(server.request_count))
+                self.send_header('X-Ratelimit-Remaining', str(max(0, server.window_budget - server.request_count)))
+                self.send_header('X-Ratelimit-Reset', str(max(1, int(600 - elapsed))))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                self._send_json({
+                    'access_token': 'fake-token',
+                    'expires_in': 3600,
+                    'scope': '*',
+                    'token_type': 'bearer',
+                })
+
+            def do_GET(self):
+                with server._lock:
+                    server.request_count += 1
+                time.sleep(server.latency)
+                parsed = urlparse(self.path)
+                parts = parsed.path.strip('/').split('/')
+                params = parse_qs(parsed.query)
+                query = params.get('q', [''])[0]
+                after = params.get('after', [None])[0]
+                limit = int(params.get('limit', ['100'])[0])
+                if len(parts) >= 3 and parts[0] == 'r' and parts[2] == 'search':
+                    self._send_json(server._listing(parts[1], query, after, limit))
+                else:
+                    self._send_json({'kind': 'Listing', 'data': {'after': None, 'children': []}})
+
+        return Handler
@@ -0,0 +1,72 @@
+"""
+SteamDB-shaped HTML pages for parser benchmarks
+
+Saved pages can be dropped into a directory as search_*.html / app_*.html
+and passed to the benchmark with --fixtures; these generated ones mirror
+their structure (navigation, large tables, inline scripts) so the
+benchmark also runs offline.
+"""
+
+import json
+import random
+from typing import Dict
+
+NAV = "".join(f'<li class="nav-item"><a href="/section/{i}/">Section {i}</a></li>' for i in range(60))
+
+
+def _page(title: str, body: str, scripts: int = 12) -> bytes:
+    script_blocks = "".join(
+        f'<script>window.__data_{i} = {json.dumps({"id": i, "values": list(range(200))})};</script>'
+        for i in range(scripts)
+    )
+    return (
+        f'<!DOCTYPE html><html lang="en"><head><meta charset="utf-8"><title>{title} · SteamDB</title>'
+        f'{script_blocks}</head><body><header><nav><ul>{NAV}</ul></nav></header>'
+        f'<div class="container">{body}</div><footer>SteamDB is not affiliated with Valve</footer></body></html>'
+    ).encode()
+
+
+def search_page(query: str, results: int = 50, seed: int = 1) -> bytes:
+    """Search results table with `results` app rows"""
+    rng = random.Random(seed)
+    rows = "".join(
+        f'<tr class="app" data-appid="{app_id}">'
+        f'<td><a href="/app/{app_id}/">{app_id}</a></td>'
+        f'<td>Game</td><td class="span8">{query} {suffix}</td>'
+        f'<td>{rng.randint(2005, 2025)}-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}</td></tr>'
+        for app_id, suffix in ((rng.randint(10, 3000000), f"Edition {i}") for i in range(results))
+    )
+    table = (
+        '<table class="table-products table-hover"><thead><tr><th>AppID</th><th>Type</th>'
+        f'<th>Name</th><th>Last Update</th></tr></thead><tbody>{rows}</tbody></table>'
+    )
+    return _page(f'Search: {query}', table)
+
+
+def app_page(app_id: int, followers: int, rows: int = 400, seed: int = 1) -> bytes:
+    """App page with an info table, a long changelog table and a followers row"""
+    rng = random.Random(seed)
+    info = "".join(f'<tr><td>Key {i}</td><td>Value {rng.random():.6f}</td></tr>' for i in range(40))
+    changelog = "".join(
+        f'<tr><td>#{rng.randint(1, 10 ** 7)}</td><td>Changed depot {rng.randint(1, 10 ** 6)} manifest</td>'
+        f'<td>{rng.randint(1, 28)} days ago</td></tr>'
+        for _ in range(rows)
+    )
+    stats = (
+        '<ul class="app-chart-numbers">'
+        f'<li><strong>In-Game</strong> <span>{rng.randint(1000, 90000):,}</span></li>'
+        '</ul><table class="table-dark"><tbody>'
+        f'<tr><td>Followers</td><td>{followers:,}</td></tr>'
+        f'<tr><td>Reviews</td><td>{rng.randint(1000, 90000):,}</td></tr></tbody></table>'
+    )
+    body = f'<table class="table">{info}</table>{stats}<table class="table">{changelog}</table>'
+    return _page(f'App {app_id}', body)
+
+
+def generated_fixtures() -> Dict[str, bytes]:
+    """One search page and one small and one large app page"""
+    return {
+        "search_elden_ring.html": search_page("Elden Ring"),
+        "app_1245620.html": app_page(1245620, 751234),
+        "app_730_large.html": app_page(730, 2104567, rows=3000, seed=2),
+    }
@@ -146,7 +146,7 @@ def main():
     print(f"\n💾 Data exported to: {csv_path}")
     
     # Save raw data
-    data_processor.save_raw_data(steam_data, reddit_mentions)
+    data_processor.save_raw_data(steam_data, reddit_mentions, app_id)
     print("💾 Raw data saved for future analysis")
 
 if __name__ == "__main__":
@@ -13,12 +13,24 @@ class RedditConfig:
     user_agent: str
     username: str = None
     password: str = None
+    max_workers: int = 6  # Concurrent subreddit/query searches
+    requests_per_minute: int = 100  # Shared budget across all search workers
+    burst: int = 10  # Requests allowed back-to-back while budget is available
+    stale_margin: int = 10  # Consecutive too-old posts before a search stops paging
+    incremental: bool = True  # Keep mentions in data_dir/mentions.db and only fetch new posts
 
 @dataclass
 class SteamConfig:
     """Steam/SteamDB configuration"""
     base_url: str = "https://steamdb.info"
     request_delay: float = 1.0  # Seconds between requests
+    burst: int = 3  # Requests allowed back-to-back while budget is available
+    http_cache: bool = True  # Keep SteamDB pages on disk and revalidate with conditional GETs
+    html_parser: str = "lxml"  # 'lxml' (XPath fast path) or 'bs4'
+    max_connections: int = 4  # Keep-alive connections, and requests in flight during bulk refreshes
+    app_list_path: str = "data/steam_app_list.json"  # Steam app list dump for the local catalog
+    fuzzy_min_score: float = 0.8  # Lowest fuzzy catalog score accepted as a match
+    fuzzy_margin: float = 0.05  # How far the accepted match must score above the runner-up
     user_agent: str = "SteamMentionsTracker/1.0"
 
 @dataclass
@@ -34,6 +46,20 @@ class AppConfig:
     data_dir: str = "data"
     days_to_collect: int = 30
     
+    # Background job settings
+    job_workers: int = 2
+    job_queue_depth: int = 20  # Queued + running jobs before new ones are refused
+    stream_workers: int = 4  # Streaming (SSE) collections, on their own pool so they never hold job workers
+    stream_queue_depth: int = 8  # Queued + running streams before new ones get a 429
+    
+    # Result cache settings
+    cache_ttl_seconds: int = 300
+    cache_max_entries: int = 128
+    
+    # Export settings
+    export_chunk_rows: int = 10000  # Rows formatted per CSV chunk
+    export_spool_rows: int = 500000  # Streamed exports above this are written to disk first
+    
     # API settings
     host: str = "localhost"
     port: int = 5000
@@ -59,10 +85,24 @@ def load_config() -> AppConfig:
         client_secret=reddit_client_secret,
         user_agent=reddit_user_agent,
         username=reddit_username,
-        password=reddit_password
+        password=reddit_password,
+        max_workers=int(os.getenv("REDDIT_MAX_WORKERS", "6")),
+        requests_per_minute=int(os.getenv("REDDIT_REQUESTS_PER_MINUTE", "100")),
+        burst=int(os.getenv("REDDIT_BURST", "10")),
+        stale_margin=int(os.getenv("REDDIT_STALE_MARGIN", "10")),
+        incremental=os.getenv("REDDIT_INCREMENTAL", "true").lower() == "true"
     )
     
-    steam_config = SteamConfig()
+    steam_config = SteamConfig(
+        request_delay=float(os.getenv("STEAM_REQUEST_DELAY", "1.0")),
+        burst=int(os.getenv("STEAM_BURST", "3")),
+        http_cache=os.getenv("STEAM_HTTP_CACHE", "true").lower() == "true",
+        html_parser=os.getenv("STEAM_HTML_PARSER", "lxml"),
+        max_connections=int(os.getenv("STEAM_MAX_CONNECTIONS", "4")),
+        app_list_path=os.getenv("STEAM_APP_LIST", os.path.join(os.getenv("DATA_DIR", "data"), "steam_app_list.json")),
+        fuzzy_min_score=float(os.getenv("STEAM_FUZZY_MIN_SCORE", "0.8")),
+        fuzzy_margin=float(os.getenv("STEAM_FUZZY_MARGIN", "0.05"))
+    )
 
     # assert the reddit credentials are not None
     if reddit_username is None or reddit_password is None:
@@ -75,6 +115,14 @@ def load_config() -> AppConfig:
         steam=steam_config,
         data_dir=os.getenv("DATA_DIR", "data"),
         days_to_collect=int(os.getenv("DAYS_TO_COLLECT", "30")),
+        job_workers=int(os.getenv("JOB_WORKERS", "2")),
+        job_queue_depth=int(os.getenv("JOB_QUEUE_DEPTH", "20")),
+        stream_workers=int(os.getenv("STREAM_WORKERS", "4")),
+        stream_queue_depth=int(os.getenv("STREAM_QUEUE_DEPTH", "8")),
+        cache_ttl_seconds=int(os.getenv("CACHE_TTL_SECONDS", "300")),
+        cache_max_entries=int(os.getenv("CACHE_MAX_ENTRIES", "128")),
+        export_chunk_rows=int(os.getenv("EXPORT_CHUNK_ROWS", "10000")),
+        export_spool_rows=int(os.getenv("EXPORT_SPOOL_ROWS", "500000")),
         host=os.getenv("HOST", "localhost"),
         port=int(os.getenv("PORT", "5000")),
         debug=os.getenv("DEBUG", "true").lower() == "true"
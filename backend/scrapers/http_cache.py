@@ -0,0 +1,170 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import logging
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+# Response headers kept with a cached body
+STORED_HEADERS = ('Content-Type', 'Content-Encoding', 'ETag', 'Last-Modified', 'Cache-Control', 'Expires', 'Date')
+
+def parse_cache_control(value: str) -> Dict[str, Optional[str]]:
+    """Parse a Cache-Control header into {directive: argument or None}"""
+    directives = {}
+    for part in value.split(','):
+        name, _, argument = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+class CachingSession(requests.Session):
+    """
+    requests.Session with an on-disk HTTP cache for GET requests
+
+    Fresh responses (Cache-Control max-age / Expires) are served from disk
+    without a request. Stale ones are revalidated with If-None-Match /
+    If-Modified-Since; a 304 serves the stored body. Responses served from
+    disk have `from_cache = True`, and callers can keep the parsed result
+    next to the body (store_parsed/load_parsed) to skip re-parsing.
+    """
+
+    def __init__(self, cache_dir: Path):
+        super().__init__()
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def _key(self, url: str, params: Any) -> str:
+        prepared_url = requests.Request('GET', url, params=params).prepare().url
+        return hashlib.sha256(prepared_url.encode()).hexdigest()
+
+    def _paths(self, key: str):
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        meta_path, body_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text())
+            meta['body'] = body_path.read_bytes()
+            return meta
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, key: str, meta: Dict[str, Any], body: Optional[bytes] = None):
+        """Atomically write the entry's metadata (and body, if given)"""
+        meta_path, body_path = self._paths(key)
+        with self._lock:
+            if body is not None:
+                tmp = body_path.with_suffix(f".{os.getpid()}.tmp")
+                tmp.write_bytes(body)
+                os.replace(tmp, body_path)
+            tmp = meta_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({k: v for k, v in meta.items() if k != 'body'}))
+            os.replace(tmp, meta_path)
+
+    @staticmethod
+    def _expires_at(headers) -> Optional[float]:
+        """Absolute freshness deadline, 0 for must-revalidate, None for don't store"""
+        directives = parse_cache_control(headers.get('Cache-Control', ''))
+        if 'no-store' in directives:
+            return None
+        if 'no-cache' in directives:
+            return 0.0
+        if directives.get('max-age'):
+            try:
+                return time.time() + int(directives['max-age'])
+            except ValueError:
+                pass
+        if headers.get('Expires'):
+            try:
+                return parsedate_to_datetime(headers['Expires']).timestamp()
+            except (TypeError, ValueError):
+                return 0.0
+        return 0.0
+
+    def _cached_response(self, url: str, entry: Dict[str, Any], key: str) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response._content = entry['body']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.url = entry['url']
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        response.cache_key = key
+        return response
+
+    def request(self, method, url, *args, params=None, headers=None, **kwargs):
+        if method.upper() != 'GET':
+            return super().request(method, url, *args, params=params, headers=headers, **kwargs)
+
+        key = self._key(url, params)
+        entry = self._load(key)
+
+        if entry and entry['expires_at'] > time.time():
+            self.hits += 1
+            return self._cached_response(url, entry, key)
+
+        headers = dict(headers or {})
+        if entry:
+            if entry['headers'].get('ETag'):
+                headers['If-None-Match'] = entry['headers']['ETag']
+            if entry['headers'].get('Last-Modified'):
+                headers['If-Modified-Since'] = entry['headers']['Last-Modified']
+
+        response = super().request(method, url, *args, params=params, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry:
+            self.revalidated += 1
+            entry['expires_at'] = self._expires_at(response.headers) or 0.0
+            for name in ('ETag', 'Last-Modified', 'Cache-Control', 'Expires', 'Date'):
+                if name in response.headers:
+                    entry['headers'][name] = response.headers[name]
+            self._write(key, entry)
+            logger.info(f"Not modified, serving cached copy of {entry['url']}")
+            return self._cached_response(url, entry, key)
+
+        self.misses += 1
+        response.from_cache = False
+        response.cache_key = key
+
+        if response.status_code == 200:
+            expires_at = self._expires_at(response.headers)
+            has_validator = 'ETag' in response.headers or 'Last-Modified' in response.headers
+            if expires_at is not None and (expires_at > time.time() or has_validator):
+                self._write(key, {
+                    'url': response.url,
+                    'expires_at': expires_at,
+                    'headers': {name: response.headers[name] for name in STORED_HEADERS if name in response.headers},
+                    'parsed': None
+                }, response.content)
+
+        return response
+
+    def store_parsed(self, response: requests.Response, parsed: Any):
+        """Keep a JSON-serializable parse result next to the cached body"""
+        key = getattr(response, 'cache_key', None)
+        entry = self._load(key) if key else None
+        if entry is not None:
+            entry['parsed'] = parsed
+            self._write(key, entry)
+
+    def load_parsed(self, response: requests.Response) -> Optional[Any]:
+        """Parse result stored for a response served from the cache, if any"""
+        if not getattr(response, 'from_cache', False):
+            return None
+        entry = self._load(response.cache_key)
+        return entry.get('parsed') if entry else None
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'revalidated': self.revalidated, 'misses': self.misses}
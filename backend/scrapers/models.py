@@ -0,0 +1,161 @@
+import sys
+from datetime import datetime, UTC
+from dataclasses import dataclass
+from typing import Iterable, List
+
+import numpy as np
+
+# Records are frozen and slotted: no per-instance __dict__, and safe to
+# share between threads and caches
+
+@dataclass(frozen=True, slots=True)
+class RedditMention:
+    """Data structure for a Reddit mention"""
+    id: str
+    title: str
+    subreddit: str
+    author: str
+    created_utc: datetime
+    score: int
+    num_comments: int
+    url: str
+
+@dataclass(frozen=True, slots=True)
+class SteamFollowerData:
+    """Data structure for Steam follower information"""
+    app_id: str
+    game_name: str
+    date: datetime
+    follower_count: int
+    source: str  # 'current', 'historical', or 'simulated'
+
+def _intern_codes(values: Iterable[str]):
+    """Map repeated strings to int32 codes into a list of unique (interned) strings"""
+    table = {}
+    codes = np.fromiter(
+        (table.setdefault(value, len(table)) for value in values),
+        dtype=np.int32
+    )
+    return codes, [sys.intern(value) for value in table]
+
+@dataclass
+class MentionBatch:
+    """
+    Columnar batch of Reddit mentions
+
+    Timestamps are int64 epoch seconds and numbers are int64 arrays.
+    Subreddits and authors repeat heavily, so each is stored once in a
+    small table and referenced by int32 codes.
+    """
+    ids: List[str]
+    titles: List[str]
+    urls: List[str]
+    created_utc: np.ndarray  # int64 epoch seconds
+    scores: np.ndarray  # int64
+    num_comments: np.ndarray  # int64
+    subreddit_codes: np.ndarray  # int32 index into subreddits
+    subreddits: List[str]
+    author_codes: np.ndarray  # int32 index into authors
+    authors: List[str]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_columns(
+        cls,
+        ids: List[str],
+        titles: List[str],
+        subreddits: Iterable[str],
+        authors: Iterable[str],
+        created_utc: Iterable[float],
+        scores: Iterable[int],
+        num_comments: Iterable[int],
+        urls: List[str]
+    ) -> 'MentionBatch':
+        """Build from per-field sequences, with created_utc in epoch seconds"""
+        subreddit_codes, subreddit_table = _intern_codes(subreddits)
+        author_codes, author_table = _intern_codes(authors)
+        return cls(
+            ids=list(ids),
+            titles=list(titles),
+            urls=list(urls),
+            created_utc=np.array(created_utc, dtype=np.float64).astype(np.int64),
+            scores=np.array(scores, dtype=np.int64),
+            num_comments=np.array(num_comments, dtype=np.int64),
+            subreddit_codes=subreddit_codes,
+            subreddits=subreddit_table,
+            author_codes=author_codes,
+            authors=author_table
+        )
+
+    @classmethod
+    def from_rows(cls, rows: List[tuple]) -> 'MentionBatch':
+        """
+        Build from (id, title, subreddit, author, created_utc, score, num_comments, url)
+        tuples, with created_utc in epoch seconds, e.g. straight from SQLite
+        """
+        columns = list(zip(*rows)) if rows else [()] * 8
+        return cls.from_columns(*columns)
+
+    @classmethod
+    def from_mentions(cls, mentions: Iterable[RedditMention]) -> 'MentionBatch':
+        """Pack mention records into columns"""
+        mentions = list(mentions)
+        # One pass per field is much cheaper than a tuple per row
+        return cls.from_columns(
+            ids=[m.id for m in mentions],
+            titles=[m.title for m in mentions],
+            subreddits=[m.subreddit for m in mentions],
+            authors=[m.author for m in mentions],
+            created_utc=[m.created_utc.timestamp() for m in mentions],
+            scores=[m.score for m in mentions],
+            num_comments=[m.num_comments for m in mentions],
+            urls=[m.url for m in mentions]
+        )
+
+    def to_mentions(self) -> List[RedditMention]:
+        """Expand into one RedditMention per row"""
+        return [
+            RedditMention(
+                id=mention_id,
+                title=title,
+                subreddit=self.subreddits[subreddit],
+                author=self.authors[author],
+                created_utc=datetime.fromtimestamp(created, UTC),
+                score=score,
+                num_comments=comments,
+                url=url
+            )
+            for mention_id, title, subreddit, author, created, score, comments, url in zip(
+                self.ids, self.titles, self.subreddit_codes.tolist(), self.author_codes.tolist(),
+                self.created_utc.tolist(), self.scores.tolist(), self.num_comments.tolist(), self.urls
+            )
+        ]
+
+@dataclass
+class FollowerSeries:
+    """Columnar follower history for one app, one array entry per point"""
+    app_id: str
+    game_name: str
+    dates: np.ndarray  # datetime64[us], oldest first
+    follower_counts: np.ndarray  # int64
+    sources: np.ndarray  # str, same values as SteamFollowerData.source
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def to_records(self) -> List[SteamFollowerData]:
+        """Expand into one SteamFollowerData per point"""
+        return [
+            SteamFollowerData(
+                app_id=self.app_id,
+                game_name=self.game_name,
+                date=point_date,
+                follower_count=count,
+                source=source
+            )
+            for point_date, count, source in zip(
+                self.dates.tolist(), self.follower_counts.tolist(), self.sources.tolist()
+            )
+        ]
@@ -1,33 +1,60 @@
 import sys
 import praw
+import prawcore
 import pandas as pd
 from datetime import datetime, timedelta, UTC
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+import threading
 import time
 import logging
+from pathlib import Path
 
 from config import config
+from scrapers.models import RedditMention
+from utils import aggregation
+from utils.rate_limiter import rate_limiter
+from utils.mention_store import MentionStore
 
 logger = logging.getLogger(__name__)
 
-@dataclass
-class RedditMention:
-    """Data structure for a Reddit mention"""
-    id: str
-    title: str
-    subreddit: str
-    author: str
-    created_utc: datetime
-    score: int
-    num_comments: int
-    url: str
+# Reddit serves listings in pages of at most 100 items
+REDDIT_PAGE_SIZE = 100
+
+# Re-read this much before a stored high-water mark to catch posts that
+# show up in search late
+HIGH_WATER_OVERLAP = timedelta(hours=1)
+
+class RateLimitedRequestor(prawcore.Requestor):
+    """prawcore requestor that paces API requests through the shared rate limiter"""
+    
+    def request(self, method, url, *args, **kwargs):
+        # Token requests go to reddit_url and don't count against the API budget
+        if not url.startswith(self.oauth_url):
+            return super().request(method, url, *args, **kwargs)
+        
+        rate_limiter.acquire(url)
+        response = super().request(method, url, *args, **kwargs)
+        rate_limiter.update_from_headers(url, response.headers)
+        
+        # The shared limiter owns pacing now; hide the headers from prawcore's
+        # per-instance limiter so worker threads don't sleep twice
+        for header in ("x-ratelimit-remaining", "x-ratelimit-used", "x-ratelimit-reset"):
+            response.headers.pop(header, None)
+        return response
 
 class RedditClient:
     """Client for collecting Reddit mentions of games"""
     
-    def __init__(self):
-        """Initialize Reddit client with credentials from config"""
+    def __init__(self, **praw_overrides):
+        """
+        Initialize Reddit client with credentials from config
+        
+        Args:
+            praw_overrides: Extra keyword arguments for praw.Reddit
+                (e.g. oauth_url/reddit_url pointing at a local test server)
+        """
         
         # Build Reddit client parameters
         reddit_params = {
@@ -44,7 +71,35 @@ class RedditClient:
         else:
             logger.info("Using read-only authentication")
         
+        reddit_params.update(praw_overrides)
+        reddit_params["requestor_class"] = RateLimitedRequestor
+        self._reddit_params = reddit_params
+        
+        # PRAW instances are not thread safe, so each search worker gets its own
+        self._local = threading.local()
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.reddit.max_workers,
+            thread_name_prefix="reddit-search"
+        )
+        
+        # Mentions persisted between collections so refreshes are incremental
+        self.store = MentionStore(Path(config.data_dir) / "mentions.db") if config.reddit.incremental else None
+        
+        # Per-query page counters from the last search, plus running totals
+        self.last_search_stats: List[Dict[str, Any]] = []
+        self.page_totals = {'searches': 0, 'pages_fetched': 0, 'pages_needed': 0, 'early_stops': 0}
+        self._stats_lock = threading.Lock()
+        
         self.reddit = praw.Reddit(**reddit_params)
+        self._local.reddit = self.reddit
+        
+        # One request budget shared by every worker thread; the server's
+        # X-Ratelimit headers adjust it from there
+        rate_limiter.configure(
+            self.reddit.config.oauth_url,
+            rate=config.reddit.requests_per_minute / 60.0,
+            capacity=config.reddit.burst
+        )
         
         # Test connection with a simple API call
         try:
@@ -56,28 +111,52 @@ class RedditClient:
             logger.error(f"Reddit client connection test failed: {e}")
             sys.exit(1)
     
+    def close(self):
+        """Stop the search worker pool; searches already running finish on their own"""
+        self._executor.shutdown(wait=False)
+    
+    def _thread_reddit(self) -> praw.Reddit:
+        """Get the PRAW instance owned by the current thread"""
+        reddit = getattr(self._local, "reddit", None)
+        if reddit is None:
+            reddit = praw.Reddit(**self._reddit_params)
+            self._local.reddit = reddit
+        return reddit
+    
     def search_game_mentions(
         self, 
         game_name: str, 
         days: int = 30,
         subreddits: Optional[List[str]] = None,
-        limit: int = 1000
+        limit: int = 1000,
+        on_query_done: Optional[Callable[[Dict[str, Any], List[RedditMention]], None]] = None
     ) -> List[RedditMention]:
         """
         Search for mentions of a game across Reddit
         
+        Every subreddit/query pair is searched concurrently on the client's
+        worker pool; all workers share one request budget. Listings are
+        sorted by new, so each search stops paging once it is past the
+        cutoff date. With the mention store enabled, a search that already
+        covers the window only fetches posts newer than its high-water mark
+        and the result is read back from the store.
+        
         Args:
             game_name: Name of the game to search for
             days: Number of days to go back
             subreddits: Specific subreddits to search (None for all)
             limit: Maximum number of posts to retrieve
+            on_query_done: Optional callback run (on the calling thread) as
+                each subreddit/query search finishes, with that search's
+                stats and the unique mentions not passed to it before. With
+                the store enabled, the first call also carries the stored
+                mentions in the window, so the calls add up to the result
             
         Returns:
             List of RedditMention objects
         """
         logger.info(f"Searching for '{game_name}' mentions over last {days} days")
         
-        mentions = []
         cutoff_date = datetime.now(UTC) - timedelta(days=days)
         
         # Search queries to try
@@ -98,69 +177,198 @@ class RedditClient:
                 "tipofmyjoystick"
             ]
         
-        for subreddit_name in subreddits:
-            try:
-                subreddit = self.reddit.subreddit(subreddit_name)
-                
-                for query in search_queries:
-                    logger.info(f"Searching r/{subreddit_name} for: {query}")
-                    
-                    # Search submissions
-                    for submission in subreddit.search(query, limit=limit, sort="new"):
-                        created_date = datetime.fromtimestamp(submission.created_utc, UTC)
-                        
-                        # Skip if too old
-                        if created_date < cutoff_date:
-                            continue
-                            
-                        mention = RedditMention(
-                            id=submission.id,
-                            title=submission.title,
-                            subreddit=submission.subreddit.display_name,
-                            author=str(submission.author) if submission.author else "[deleted]",
-                            created_utc=created_date,
-                            score=submission.score,
-                            num_comments=submission.num_comments,
-                            url=submission.url
-                        )
-                        
-                        mentions.append(mention)
-                        
-                    # Rate limiting
-                    time.sleep(1)
-                    
-            except Exception as e:
-                logger.error(f"Error searching r/{subreddit_name}: {e}")
-                continue
+        # Mentions deduplicated by post ID as workers find them
+        unique_mentions: Dict[str, RedditMention] = {}
+        mentions_lock = threading.Lock()
         
-        # Remove duplicates based on post ID
-        unique_mentions = {}
-        for mention in mentions:
-            if mention.id not in unique_mentions:
-                unique_mentions[mention.id] = mention
+        futures = [
+            self._executor.submit(
+                self._search_subreddit,
+                subreddit_name, query, self._query_cutoff(game_name, subreddit_name, query, cutoff_date),
+                limit, unique_mentions, mentions_lock
+            )
+            for subreddit_name in subreddits
+            for query in search_queries
+        ]
+        
+        if on_query_done:
+            # Stored history goes out once with the first call; after that
+            # only mentions the workers added since the last call. Dicts keep
+            # insertion order, so those are the entries past `taken`.
+            reported = {mention.id: mention for mention in self.store.get_mentions(game_name, cutoff_date)} if self.store else {}
+            new_mentions = list(reported.values())
+            taken = 0
+            for future in as_completed(futures):
+                with mentions_lock:
+                    found = list(islice(unique_mentions.values(), taken, None))
+                    taken = len(unique_mentions)
+                for mention in found:
+                    if mention.id not in reported:
+                        reported[mention.id] = mention
+                        new_mentions.append(mention)
+                on_query_done(future.result(), new_mentions)
+                new_mentions = []
+        
+        query_stats = [future.result() for future in futures]
+        
+        if self.store:
+            self.store.add_mentions(game_name, unique_mentions.values())
+            for stats in query_stats:
+                if not stats['failed']:
+                    self.store.set_high_water_mark(
+                        game_name, stats['subreddit'], stats['query'],
+                        stats['newest_utc'], stats['covered_from_utc']
+                    )
+            unique_mentions = {mention.id: mention for mention in self.store.get_mentions(game_name, cutoff_date)}
+        
+        with self._stats_lock:
+            self.last_search_stats = query_stats
+            self.page_totals['searches'] += len(query_stats)
+            for stats in query_stats:
+                self.page_totals['pages_fetched'] += stats['pages_fetched']
+                self.page_totals['pages_needed'] += stats['pages_needed']
+                self.page_totals['early_stops'] += stats['stopped_early']
         
         result = list(unique_mentions.values())
-        logger.info(f"Found {len(result)} unique mentions")
+        pages_fetched = sum(stats['pages_fetched'] for stats in query_stats)
+        pages_needed = sum(stats['pages_needed'] for stats in query_stats)
+        logger.info(f"Found {len(result)} unique mentions ({pages_fetched} pages fetched, {pages_needed} needed)")
         
         return result
     
+    def _query_cutoff(self, game_name: str, subreddit_name: str, query: str, cutoff_date: datetime) -> datetime:
+        """
+        Oldest post a search has to fetch: the window cutoff, or just before
+        the stored high-water mark when the store already covers the window
+        """
+        if not self.store:
+            return cutoff_date
+        
+        mark = self.store.get_high_water_mark(game_name, subreddit_name, query)
+        if mark is None:
+            return cutoff_date
+        
+        newest_utc, covered_from_utc = mark
+        if newest_utc is None or covered_from_utc > cutoff_date.timestamp():
+            # Nothing seen yet, or the window reaches further back than
+            # anything collected so far
+            return cutoff_date
+        
+        return max(cutoff_date, datetime.fromtimestamp(newest_utc, UTC) - HIGH_WATER_OVERLAP)
+    
+    def _search_subreddit(
+        self,
+        subreddit_name: str,
+        query: str,
+        cutoff_date: datetime,
+        limit: int,
+        unique_mentions: Dict[str, RedditMention],
+        mentions_lock: threading.Lock
+    ) -> Dict[str, Any]:
+        """
+        Run one subreddit/query search and record unseen mentions
+        
+        Returns:
+            Page counters for the query: posts seen and in window, pages
+            fetched vs. pages that actually held in-window posts, plus
+            the newest post and the earliest time the search fully covered
+        """
+        stale_margin = config.reddit.stale_margin
+        seen = 0
+        pages_fetched = 0
+        last_in_window = 0
+        in_window = 0
+        stale_streak = 0
+        stopped_early = False
+        failed = False
+        newest_utc = None
+        oldest_utc = None
+        started = time.perf_counter()
+        
+        try:
+            subreddit = self._thread_reddit().subreddit(subreddit_name)
+            logger.info(f"Searching r/{subreddit_name} for: {query}")
+            
+            # Search submissions. The listing is fetched lazily: one request
+            # when iteration starts (even if it comes back empty), then one
+            # more each time the next item lies past a full page
+            pages_fetched = 1
+            for submission in subreddit.search(query, limit=limit, sort="new"):
+                if seen and seen % REDDIT_PAGE_SIZE == 0:
+                    pages_fetched += 1
+                seen += 1
+                oldest_utc = min(oldest_utc or submission.created_utc, submission.created_utc)
+                created_date = datetime.fromtimestamp(submission.created_utc, UTC)
+                
+                # Newest first, so a run of old posts means the rest are older
+                # too; the margin tolerates a few out-of-order items
+                if created_date < cutoff_date:
+                    stale_streak += 1
+                    if stale_streak >= stale_margin:
+                        stopped_early = True
+                        break
+                    continue
+                
+                stale_streak = 0
+                in_window += 1
+                last_in_window = seen
+                newest_utc = max(newest_utc or 0.0, submission.created_utc)
+                
+                with mentions_lock:
+                    if submission.id in unique_mentions:
+                        continue
+                
+                mention = RedditMention(
+                    id=submission.id,
+                    title=submission.title,
+                    # Interned: the same few subreddits and authors repeat across thousands of posts
+                    subreddit=sys.intern(submission.subreddit.display_name),
+                    author=sys.intern(str(submission.author)) if submission.author else "[deleted]",
+                    created_utc=created_date,
+                    score=submission.score,
+                    num_comments=submission.num_comments,
+                    url=submission.url
+                )
+                
+                with mentions_lock:
+                    unique_mentions.setdefault(mention.id, mention)
+                    
+        except Exception as e:
+            logger.error(f"Error searching r/{subreddit_name} for {query}: {e}")
+            failed = True
+        
+        # Stopping past the cutoff or running out of results means nothing
+        # between the cutoff and now was missed. A search cut off by limit
+        # only covers back to the oldest post it reached.
+        covered_from_utc = cutoff_date.timestamp()
+        if seen >= limit and not stopped_early and oldest_utc is not None:
+            covered_from_utc = max(covered_from_utc, oldest_utc)
+        
+        return {
+            'subreddit': subreddit_name,
+            'query': query,
+            'posts_seen': seen,
+            'posts_in_window': in_window,
+            'pages_fetched': pages_fetched,
+            'pages_needed': max(1, -(-last_in_window // REDDIT_PAGE_SIZE)),
+            'stopped_early': stopped_early,
+            'failed': failed,
+            'newest_utc': newest_utc,
+            'covered_from_utc': covered_from_utc,
+            'seconds': round(time.perf_counter() - started, 3)
+        }
+    
+    def search_stats(self) -> Dict[str, Any]:
+        """Page counters for metrics: running totals and the last search's queries"""
+        with self._stats_lock:
+            return {
+                'totals': dict(self.page_totals),
+                'last_search': list(self.last_search_stats)
+            }
+    
     def mentions_to_dataframe(self, mentions: List[RedditMention]) -> pd.DataFrame:
         """Convert mentions to pandas DataFrame"""
-        data = []
-        for mention in mentions:
-            data.append({
-                'id': mention.id,
-                'title': mention.title,
-                'subreddit': mention.subreddit,
-                'author': mention.author,
-                'created_utc': mention.created_utc,
-                'date': mention.created_utc.date(),
-                'score': mention.score,
-                'num_comments': mention.num_comments,
-                'url': mention.url
-            })
-        
-        return pd.DataFrame(data)
+        return aggregation.mentions_to_dataframe(mentions)
     
     def get_daily_mention_counts(self, mentions: List[RedditMention]) -> pd.DataFrame:
         """
@@ -169,17 +377,4 @@ class RedditClient:
         Returns:
             DataFrame with columns: date, mention_count, total_score, total_comments
         """
-        df = self.mentions_to_dataframe(mentions)
-        
-        if df.empty:
-            return pd.DataFrame(columns=['date', 'mention_count', 'total_score', 'total_comments'])
-        
-        daily_stats = df.groupby('date').agg({
-            'id': 'count',
-            'score': 'sum', 
-            'num_comments': 'sum'
-        }).reset_index()
-        
-        daily_stats.columns = ['date', 'mention_count', 'total_score', 'total_comments']
-        
-        return daily_stats
+        return aggregation.get_daily_mention_counts(mentions)
@@ -0,0 +1,179 @@
+import re
+import logging
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple, Type
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    from lxml import etree, html as lxml_html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+APP_LINK_PATTERN = re.compile(r'/app/(\d+)/')
+FOLLOWERS_PATTERN = re.compile(r'Followers?', re.IGNORECASE)
+SCRIPT_FOLLOWERS_PATTERN = re.compile(r'"followers?":\s*(\d+)', re.IGNORECASE)
+NUMBER_PATTERN = re.compile(r'\d[\d,]*')
+
+def _first_number(text: str) -> Optional[int]:
+    match = NUMBER_PATTERN.search(text)
+    return int(match.group().replace(',', '')) if match else None
+
+def _script_follower_count(script_text: str) -> Optional[int]:
+    if 'followers' not in script_text.lower():
+        return None
+    match = SCRIPT_FOLLOWERS_PATTERN.search(script_text)
+    return int(match.group(1)) if match else None
+
+class SteamDBParser(ABC):
+    """
+    Extracts search results and follower counts from SteamDB pages
+
+    Backends must implement both parse methods; a backend missing one
+    fails when it's created rather than on its first page.
+    """
+    name = 'base'
+
+    @abstractmethod
+    def parse_search_result(self, content: bytes) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        First (most relevant) app in a search results page
+
+        Returns:
+            Tuple of (app_id, game_name or None), or None if the page has no results
+        """
+
+    @abstractmethod
+    def parse_follower_count(self, content: bytes) -> Optional[int]:
+        """
+        Follower count from an app page
+
+        Looks for the value next to a "Followers" label first, then for a
+        "followers" key in the page scripts.
+
+        Returns:
+            Follower count, or None if the page doesn't show one
+        """
+
+class SoupParser(SteamDBParser):
+    """BeautifulSoup backend; SoupStrainer limits the tree to the nodes we read"""
+    name = 'bs4'
+
+    def __init__(self, features: str = 'html.parser'):
+        self.features = features
+
+    def parse_search_result(self, content: bytes) -> Optional[Tuple[str, Optional[str]]]:
+        soup = BeautifulSoup(content, self.features, parse_only=SoupStrainer('tr', class_='app'))
+        first_result = soup.find('tr', class_='app')
+        if first_result is None:
+            return None
+
+        app_link = first_result.find('a', href=APP_LINK_PATTERN)
+        if not app_link:
+            raise Exception("Could not find app link in search results")
+
+        game_name_elem = first_result.find('td', class_='span8')
+        exact_name = game_name_elem.get_text(strip=True) if game_name_elem else None
+        return APP_LINK_PATTERN.search(app_link['href']).group(1), exact_name
+
+    def parse_follower_count(self, content: bytes) -> Optional[int]:
+        # The label's siblings can be anywhere in the page, so this needs the full tree
+        soup = BeautifulSoup(content, self.features)
+
+        for element in soup.find_all(string=FOLLOWERS_PATTERN):
+            parent = element.parent
+            if parent:
+                for sibling in parent.find_next_siblings():
+                    follower_count = _first_number(sibling.get_text(strip=True))
+                    if follower_count is not None:
+                        return follower_count
+
+        for script in soup.find_all('script'):
+            if script.string:
+                follower_count = _script_follower_count(script.string)
+                if follower_count is not None:
+                    return follower_count
+
+        return None
+
+class LxmlParser(SteamDBParser):
+    """lxml backend; XPath selects only the result rows, labels and scripts"""
+    name = 'lxml'
+
+    XPATH_NAMESPACES = {'re': 'http://exslt.org/regular-expressions'}
+
+    def __init__(self):
+        self._first_result = etree.XPath(
+            '//tr[contains(concat(" ", normalize-space(@class), " "), " app ")][1]'
+        )
+        self._app_href = etree.XPath('.//a[contains(@href, "/app/")]/@href')
+        self._name_cell = etree.XPath(
+            './/td[contains(concat(" ", normalize-space(@class), " "), " span8 ")][1]'
+        )
+        self._follower_labels = etree.XPath(
+            '//text()[re:test(., "Followers?", "i")]', namespaces=self.XPATH_NAMESPACES
+        )
+        self._follower_scripts = etree.XPath(
+            '//script/text()[re:test(., "followers?", "i")]', namespaces=self.XPATH_NAMESPACES
+        )
+
+    def parse_search_result(self, content: bytes) -> Optional[Tuple[str, Optional[str]]]:
+        rows = self._first_result(lxml_html.fromstring(content))
+        if not rows:
+            return None
+
+        for href in self._app_href(rows[0]):
+            match = APP_LINK_PATTERN.search(href)
+            if match:
+                break
+        else:
+            raise Exception("Could not find app link in search results")
+
+        name_cells = self._name_cell(rows[0])
+        exact_name = name_cells[0].text_content().strip() if name_cells else None
+        return match.group(1), exact_name
+
+    def parse_follower_count(self, content: bytes) -> Optional[int]:
+        tree = lxml_html.fromstring(content)
+
+        for text in self._follower_labels(tree):
+            # A tail string belongs to its element's parent, as in the DOM
+            parent = text.getparent()
+            if text.is_tail:
+                parent = parent.getparent()
+            if parent is None:
+                continue
+            for sibling in parent.itersiblings():
+                if not isinstance(sibling.tag, str):
+                    continue  # comments and processing instructions
+                follower_count = _first_number(''.join(s.strip() for s in sibling.itertext()))
+                if follower_count is not None:
+                    return follower_count
+
+        for script_text in self._follower_scripts(tree):
+            follower_count = _script_follower_count(script_text)
+            if follower_count is not None:
+                return follower_count
+
+        return None
+
+PARSERS: Dict[str, Type[SteamDBParser]] = {
+    SoupParser.name: SoupParser,
+    LxmlParser.name: LxmlParser,
+}
+
+def get_parser(name: str = 'lxml') -> SteamDBParser:
+    """
+    Parser backend by name ('lxml' or 'bs4')
+
+    Falls back to BeautifulSoup when lxml isn't installed.
+    """
+    if name not in PARSERS:
+        raise ValueError(f"Unknown SteamDB parser '{name}', expected one of {sorted(PARSERS)}")
+    if name == LxmlParser.name and not LXML_AVAILABLE:
+        logger.warning("lxml is not installed, falling back to the BeautifulSoup parser")
+        name = SoupParser.name
+    return PARSERS[name]()
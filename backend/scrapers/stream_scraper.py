@@ -1,34 +1,35 @@
 import requests
-from bs4 import BeautifulSoup
 import pandas as pd
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
-import time
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator, Callable
 import logging
-import re
+from pathlib import Path
 import json
-import random
+import math
 
 from config import config
+from scrapers.models import SteamFollowerData, FollowerSeries
+from scrapers.http_cache import CachingSession
+from scrapers.steamdb_parsers import get_parser
+from utils import aggregation, simulation, stable_ids
+from utils.rate_limiter import rate_limiter, RateLimitedAdapter
+from utils.follower_store import FollowerStore
+from utils.app_registry import app_registry
 
 logger = logging.getLogger(__name__)
 
-@dataclass
-class SteamFollowerData:
-    """Data structure for Steam follower information"""
-    app_id: str
-    game_name: str
-    date: datetime
-    follower_count: int
-    source: str  # 'current', 'historical', or 'simulated'
-
 class SteamDBScraper:
     """Scraper for SteamDB follower data with fallback simulation"""
     
     def __init__(self):
         """Initialize the scraper with session and headers"""
-        self.session = requests.Session()
+        if config.steam.http_cache:
+            # Pages are kept under data_dir and revalidated with conditional GETs
+            self.session = CachingSession(Path(config.data_dir) / "http_cache")
+        else:
+            self.session = requests.Session()
         # More realistic browser headers to avoid 403 errors
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -45,26 +46,37 @@ class SteamDBScraper:
             'Cache-Control': 'max-age=0',
         })
         self.base_url = config.steam.base_url
-        self.request_delay = max(2.0, config.steam.request_delay)  # Minimum 2 seconds delay
-        
-        # Game database for fallback data
-        self.game_database = {
-            'cyberpunk 2077': {'app_id': '1091500', 'base_followers': 1250000},
-            'the witcher 3': {'app_id': '292030', 'base_followers': 890000},
-            'elden ring': {'app_id': '1245620', 'base_followers': 750000},
-            'baldurs gate 3': {'app_id': '1086940', 'base_followers': 680000},
-            'counter-strike 2': {'app_id': '730', 'base_followers': 2100000},
-            'dota 2': {'app_id': '570', 'base_followers': 1800000},
-            'grand theft auto v': {'app_id': '271590', 'base_followers': 1950000},
-            'red dead redemption 2': {'app_id': '1174180', 'base_followers': 920000},
-            'fallout 4': {'app_id': '377160', 'base_followers': 730000},
-            'skyrim': {'app_id': '489830', 'base_followers': 840000},
-        }
+        self.request_delay = config.steam.request_delay
+        self.follower_store = FollowerStore(Path(config.data_dir) / "followers.db")
+        
+        # Pace SteamDB through the shared limiter: bursts while budget is
+        # available, waits only when empty or when SteamDB sends Retry-After.
+        # The limiter sits on the transport, so fresh cache hits never wait.
+        # A delay of 0 turns throttling off.
+        rate_limiter.configure(
+            self.base_url,
+            rate=1.0 / self.request_delay if self.request_delay > 0 else math.inf,
+            capacity=config.steam.burst
+        )
+        # One keep-alive pool per host; block=True caps open connections
+        # at max_connections instead of opening throwaway extras
+        self.session.mount(self.base_url, RateLimitedAdapter(
+            pool_connections=1,
+            pool_maxsize=config.steam.max_connections,
+            pool_block=True
+        ))
+        self.parser = get_parser(config.steam.html_parser)
+        
+        # Name <-> app_id registry shared by every scraper; its local Steam
+        # app catalog resolves most names without touching SteamDB
+        self.registry = app_registry
+        self.catalog = app_registry.load_catalog(config.steam.app_list_path, Path(config.data_dir) / "app_catalog")
         
     def search_game_by_name(self, game_name: str) -> Optional[Tuple[str, str]]:
         """
         Search for a game on SteamDB and return its app_id and exact name
-        Falls back to local database if web scraping fails
+        Checks the shared name registry and app catalog before scraping, and
+        falls back to simulated data if web scraping fails
         
         Args:
             game_name: Name of the game to search for
@@ -74,12 +86,19 @@ class SteamDBScraper:
         """
         logger.info(f"Searching for game: {game_name}")
         
-        # First try local database for common games
-        game_lower = game_name.lower().strip()
-        if game_lower in self.game_database:
-            game_info = self.game_database[game_lower]
-            logger.info(f"Found in local database: {game_name} (App ID: {game_info['app_id']})")
-            return game_info['app_id'], game_name
+        # First the registry: built-in games, earlier finds and exact catalog names
+        match = self.registry.app_id(game_name)
+        if match:
+            logger.info(f"Found in local registry: {match[1]} (App ID: {match[0]})")
+            return match
+        
+        # Then a fuzzy match against the app catalog, only when it's unambiguous
+        if self.catalog is not None:
+            match = self.catalog.fuzzy_match(game_name, config.steam.fuzzy_min_score, config.steam.fuzzy_margin)
+            if match:
+                app_id, exact_name, score = match
+                logger.info(f"Fuzzy match in app catalog: {exact_name} (App ID: {app_id}, score {score})")
+                return app_id, exact_name
         
         # Try web scraping with improved anti-detection
         try:
@@ -89,9 +108,49 @@ class SteamDBScraper:
             
         # Fallback: create simulated data for demonstration
         logger.info(f"Creating simulated data for '{game_name}'")
-        simulated_app_id = str(hash(game_name) % 1000000 + 1000000)  # Generate consistent fake ID
+        simulated_app_id = stable_ids.simulated_app_id(game_name)  # Same ID in every process
+        self.registry.add(simulated_app_id, game_name)
         return simulated_app_id, game_name
     
+    def suggest_games(self, game_name: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        Ranked catalog matches for a possibly misspelled game name
+        
+        Args:
+            game_name: Name typed by the user
+            limit: Maximum number of suggestions
+            
+        Returns:
+            List of {'app_id', 'game_name', 'score'} dicts, best first
+            (empty when no app catalog is loaded)
+        """
+        if self.catalog is None:
+            return []
+        return [
+            {'app_id': app_id, 'game_name': name, 'score': score}
+            for app_id, name, score in self.catalog.fuzzy(game_name, limit=limit)
+        ]
+    
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """GET a SteamDB page (rate limited, and cached when enabled)"""
+        response = self.session.get(url, timeout=10, **kwargs)
+        
+        if response.status_code in (429, 503) and 'Retry-After' in response.headers:
+            raise Exception(f"SteamDB rate limited request ({response.status_code}), retry after {response.headers['Retry-After']}s")
+        
+        return response
+    
+    def _cached_parse(self, response: requests.Response) -> Optional[Any]:
+        """Parse result stored with a page that came back unchanged from the HTTP cache"""
+        if isinstance(self.session, CachingSession):
+            return self.session.load_parsed(response)
+        return None
+    
+    def _store_parse(self, response: requests.Response, parsed: Any):
+        """Keep a parse result with the cached page so a 304 can skip parsing"""
+        if isinstance(self.session, CachingSession):
+            self.session.store_parsed(response, parsed)
+    
     def _web_search_game(self, game_name: str) -> Optional[Tuple[str, str]]:
         """Internal method for web scraping SteamDB search"""
         search_url = f"{self.base_url}/search/"
@@ -102,41 +161,28 @@ class SteamDBScraper:
             'category': 0
         }
         
-        # Add random delay to appear more human-like
-        time.sleep(random.uniform(1.0, 3.0))
-        
-        response = self.session.get(search_url, params=params, timeout=10)
+        response = self._get(search_url, params=params)
         
         if response.status_code == 403:
             raise Exception("SteamDB blocked request (403 Forbidden)")
         
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
         
-        # Look for search results
-        search_results = soup.find_all('tr', class_='app')
+        cached = self._cached_parse(response)
+        if cached:
+            logger.info(f"Search page unchanged, using cached result: {cached[1]} (App ID: {cached[0]})")
+            self.registry.add(cached[0], cached[1])
+            return cached[0], cached[1]
         
-        if not search_results:
+        result = self.parser.parse_search_result(response.content)
+        if not result:
             raise Exception(f"No search results found for '{game_name}'")
         
-        # Take the first result (most relevant)
-        first_result = search_results[0]
-        
-        # Extract app ID from the link
-        app_link = first_result.find('a', href=re.compile(r'/app/\d+/'))
-        if not app_link:
-            raise Exception("Could not find app link in search results")
-            
-        app_id = re.search(r'/app/(\d+)/', app_link['href']).group(1)
-        
-        # Extract game name
-        game_name_elem = first_result.find('td', class_='span8')
-        if game_name_elem:
-            exact_name = game_name_elem.get_text(strip=True)
-        else:
-            exact_name = game_name
+        app_id, exact_name = result[0], result[1] or game_name
         
         logger.info(f"Found game via web search: {exact_name} (App ID: {app_id})")
+        self.registry.add(app_id, exact_name)
+        self._store_parse(response, [app_id, exact_name])
         return app_id, exact_name
     
     def get_current_follower_count(self, app_id: str) -> Optional[int]:
@@ -150,141 +196,227 @@ class SteamDBScraper:
         Returns:
             Current follower count or None if not found
         """
+        return self._current_follower_count_with_source(app_id)[0]
+    
+    def _current_follower_count_with_source(self, app_id: str) -> Tuple[Optional[int], str]:
+        """Current follower count plus where it came from ('current' or 'simulated')"""
         # Try web scraping first
         try:
-            return self._web_get_follower_count(app_id)
+            return self._web_get_follower_count(app_id), 'current'
         except Exception as e:
             logger.warning(f"Web scraping failed for app {app_id}: {e}")
             
         # Fallback to simulated data
-        return self._get_simulated_follower_count(app_id)
+        return self._get_simulated_follower_count(app_id), 'simulated'
     
     def _web_get_follower_count(self, app_id: str) -> Optional[int]:
         """Internal method for web scraping follower count"""
         url = f"{self.base_url}/app/{app_id}/"
         
-        time.sleep(self.request_delay)
-        response = self.session.get(url, timeout=10)
+        response = self._get(url)
         
         if response.status_code == 403:
             raise Exception("SteamDB blocked request (403 Forbidden)")
             
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Look for follower count using multiple methods
-        # Method 1: Look for "Followers" text
-        follower_elements = soup.find_all(string=re.compile(r'Followers?', re.IGNORECASE))
-        
-        for element in follower_elements:
-            parent = element.parent
-            if parent:
-                siblings = parent.find_next_siblings()
-                for sibling in siblings:
-                    text = sibling.get_text(strip=True)
-                    numbers = re.findall(r'[\d,]+', text)
-                    if numbers:
-                        follower_count = int(numbers[0].replace(',', ''))
-                        logger.info(f"Found current follower count: {follower_count}")
-                        return follower_count
-        
-        # Method 2: Look in page scripts for JSON data
-        scripts = soup.find_all('script')
-        for script in scripts:
-            if script.string and 'followers' in script.string.lower():
-                try:
-                    numbers = re.findall(r'"followers?":\s*(\d+)', script.string, re.IGNORECASE)
-                    if numbers:
-                        follower_count = int(numbers[0])
-                        logger.info(f"Found follower count in script: {follower_count}")
-                        return follower_count
-                except:
-                    continue
+        
+        cached = self._cached_parse(response)
+        if cached is not None:
+            logger.info(f"App page unchanged, using cached follower count: {cached}")
+            return cached
+        
+        follower_count = self.parser.parse_follower_count(response.content)
+        if follower_count is not None:
+            logger.info(f"Found current follower count: {follower_count}")
+            self._store_parse(response, follower_count)
+            return follower_count
         
         raise Exception(f"Could not find follower count for app {app_id}")
     
-    def _get_simulated_follower_count(self, app_id: str) -> int:
-        """Generate simulated follower count for demonstration"""
-        # Use app_id as seed for consistent results
-        random.seed(int(app_id) if app_id.isdigit() else hash(app_id))
-        
-        # Base follower count between 50k and 2M
-        base_count = random.randint(50000, 2000000)
+    def refresh_followers(
+        self,
+        app_ids: Iterable[str],
+        max_in_flight: Optional[int] = None,
+        batch_size: int = 100,
+        on_failure: Optional[Callable[[str], None]] = None
+    ) -> Iterator[SteamFollowerData]:
+        """
+        Fetch current follower counts for many apps, yielding each as it completes
         
-        # Add some daily variation
-        today = datetime.now().day
-        variation = random.randint(-5000, 15000) + (today * 100)
+        Requests share the session's keep-alive pool and run at most
+        `max_in_flight` at a time; the shared rate limiter still paces
+        SteamDB, so a wider window only hides latency. Snapshots are
+        appended to the follower store in batches. Apps whose count
+        couldn't be scraped are reported as failures, never yielded or
+        stored with a simulated count.
         
-        follower_count = max(10000, base_count + variation)
+        Args:
+            app_ids: Steam application IDs (consumed lazily)
+            max_in_flight: Concurrent requests (default: config.steam.max_connections)
+            batch_size: Snapshots buffered before each store write
+            on_failure: Optional callback run with the app_id of each
+                app that couldn't be scraped
+            
+        Yields:
+            SteamFollowerData per scraped app, in completion order
+        """
+        max_in_flight = max_in_flight or config.steam.max_connections
+        pending_ids = iter(app_ids)
+        in_flight = {}
+        batch = []
+        
+        with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix='steam-refresh') as executor:
+            def fill_window():
+                for app_id in pending_ids:
+                    in_flight[executor.submit(self._current_follower_count_with_source, app_id)] = app_id
+                    if len(in_flight) >= max_in_flight:
+                        return
+            
+            try:
+                fill_window()
+                while in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        app_id = in_flight.pop(future)
+                        follower_count, source = future.result()
+                        if not follower_count or source != 'current':
+                            logger.warning(f"Refresh failed for app {app_id}: no follower count from SteamDB")
+                            if on_failure:
+                                on_failure(app_id)
+                            continue
+                        
+                        snapshot = SteamFollowerData(
+                            app_id=app_id,
+                            game_name=self.get_game_name(app_id),
+                            date=datetime.now(),
+                            follower_count=follower_count,
+                            source=source
+                        )
+                        batch.append(snapshot)
+                        if len(batch) >= batch_size:
+                            self.follower_store.append(batch)
+                            batch = []
+                        yield snapshot
+                    fill_window()
+            finally:
+                # Also runs when the caller stops iterating early
+                for future in in_flight:
+                    future.cancel()
+                self.follower_store.append(batch)
+    
+    def _get_simulated_follower_count(self, app_id: str) -> int:
+        """Generate simulated follower count for demonstration"""
+        # Seeded from a stable hash of app_id, so every worker agrees
+        follower_count = simulation.simulate_current_follower_count(app_id, datetime.now().day)
         logger.info(f"Generated simulated follower count for app {app_id}: {follower_count}")
         return follower_count
     
     def get_follower_history(self, app_id: str, days: int = 30) -> List[SteamFollowerData]:
         """
-        Get historical follower data (simulated for demonstration)
+        Get historical follower data
+        
+        Reads the window's observed counts from the snapshot store. Only
+        today's point is scraped when missing. Older days with no
+        observation are simulated from today's count on every call and
+        never stored. A simulated count for today isn't stored either,
+        so the next call tries SteamDB again.
         
         Args:
             app_id: Steam application ID
             days: Number of days of history to retrieve
             
         Returns:
-            List of SteamFollowerData objects
+            List of SteamFollowerData objects, oldest first
         """
-        logger.info(f"Generating follower history for app {app_id}")
-        
-        game_name = self.get_game_name(app_id)
-        current_count = self.get_current_follower_count(app_id)
-        
-        if not current_count:
-            return []
-        
-        data = []
-        
-        # Generate historical data going backwards from today
-        for i in range(days):
-            date = datetime.now() - timedelta(days=i)
+        today = datetime.now().date()
+        start = today - timedelta(days=days - 1)
+        stored = self.follower_store.latest_per_day(app_id, start, today)
+        
+        anchor = stored.get(today)
+        if anchor is None:
+            logger.info(f"No snapshot for app {app_id} today, fetching current follower count")
+            current_count, source = self._current_follower_count_with_source(app_id)
+            if not current_count:
+                return []
             
-            # Simulate realistic follower growth/decline patterns
-            random.seed(int(app_id) + i if app_id.isdigit() else hash(app_id) + i)
-            
-            # Simulate slight daily variations
-            daily_change = random.randint(-2000, 5000)
-            base_reduction = i * random.randint(10, 100)  # Slight historical reduction
-            
-            historical_count = max(
-                current_count // 2,  # Never go below half current count
-                current_count - base_reduction + daily_change
+            anchor = SteamFollowerData(
+                app_id=app_id,
+                game_name=self.get_game_name(app_id),
+                date=datetime.now(),
+                follower_count=current_count,
+                source=source
             )
+            stored[today] = anchor
+            if source == 'current':
+                self.follower_store.append([anchor])
+        
+        missing = [i for i in range(1, days) if today - timedelta(days=i) not in stored]
+        if missing:
+            logger.info(f"Simulating {len(missing)} unobserved days of follower history for app {app_id}")
+            counts = simulation.simulate_follower_counts(app_id, anchor.follower_count, np.array(missing))
+            source = 'historical' if app_id in simulation.HISTORICAL_APPS else 'simulated'
             
-            data.append(SteamFollowerData(
-                app_id=app_id,
-                game_name=game_name,
-                date=date,
-                follower_count=historical_count,
-                source='simulated' if app_id not in ['1091500'] else 'historical'
-            ))
+            for days_ago, count in zip(missing, counts.tolist()):
+                point = SteamFollowerData(
+                    app_id=app_id,
+                    game_name=anchor.game_name,
+                    date=anchor.date - timedelta(days=days_ago),
+                    follower_count=count,
+                    source=source
+                )
+                stored[point.date.date()] = point
         
         # Sort by date (oldest first)
-        data.reverse()
+        return [stored[day] for day in sorted(stored)]
+    
+    def simulate_follower_history(
+        self,
+        app_id: str,
+        days: int = 30,
+        current_count: Optional[int] = None,
+        store: bool = False
+    ) -> FollowerSeries:
+        """
+        Simulate a window of follower history as arrays, without per-day objects
+        
+        Meant for large backfills: the whole window comes from seeded
+        numpy generators in one call and is deterministic per app_id.
         
-        return data
+        Args:
+            app_id: Steam application ID
+            days: Number of days of history, ending today
+            current_count: Today's count (fetched, or simulated, when omitted)
+            store: Also append the series' observed anchor to the follower store
+            
+        Returns:
+            FollowerSeries, oldest first
+        """
+        source = 'current'
+        if current_count is None:
+            current_count, source = self._current_follower_count_with_source(app_id)
+        
+        series = simulation.simulate_follower_history(
+            app_id,
+            self.get_game_name(app_id),
+            current_count,
+            datetime.now(),
+            days,
+            anchor_source=source
+        )
+        if store:
+            self.follower_store.append_series(series)
+        return series
     
     def get_game_name(self, app_id: str) -> str:
         """Get game name from app ID"""
-        # Check local database first
-        for game_name, info in self.game_database.items():
-            if info['app_id'] == app_id:
-                return game_name.title()
-        
-        # For known games, return proper names
-        known_apps = {
-            '1091500': 'Cyberpunk 2077',
-            '292030': 'The Witcher 3: Wild Hunt',
-            '1245620': 'Elden Ring',
-            '730': 'Counter-Strike 2',
-        }
-        
-        return known_apps.get(app_id, f"Game_{app_id}")
+        return self.registry.name(app_id) or f"Game_{app_id}"
+    
+    def get_game_names(self, app_ids: List[str]) -> List[str]:
+        """Get game names for many app IDs in one registry lookup"""
+        return [
+            name or f"Game_{app_id}"
+            for app_id, name in zip(app_ids, self.registry.names(app_ids))
+        ]
     
     def collect_data(self, game_name: str, days: int = 30) -> List[SteamFollowerData]:
         """
@@ -313,20 +445,7 @@ class SteamDBScraper:
     
     def follower_data_to_dataframe(self, data: List[SteamFollowerData]) -> pd.DataFrame:
         """Convert follower data to pandas DataFrame"""
-        if not data:
-            return pd.DataFrame()
-        
-        df_data = []
-        for item in data:
-            df_data.append({
-                'app_id': item.app_id,
-                'game_name': item.game_name,
-                'date': item.date.date(),
-                'follower_count': item.follower_count,
-                'source': item.source
-            })
-        
-        return pd.DataFrame(df_data)
+        return aggregation.follower_data_to_dataframe(data)
     
     def get_daily_follower_counts(self, data: List[SteamFollowerData]) -> pd.DataFrame:
         """
@@ -338,14 +457,4 @@ class SteamDBScraper:
         Returns:
             DataFrame with columns: date, steam_followers
         """
-        df = self.follower_data_to_dataframe(data)
-        
-        if df.empty:
-            return pd.DataFrame(columns=['date', 'steam_followers'])
-        
-        # Group by date and get the latest follower count for each day
-        daily_data = df.groupby('date')['follower_count'].last().reset_index()
-        daily_data.rename(columns={'follower_count': 'steam_followers'}, inplace=True)
-        daily_data['date'] = pd.to_datetime(daily_data['date'])
-        
-        return daily_data.sort_values('date')
+        return aggregation.get_daily_follower_counts(data)
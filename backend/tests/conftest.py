@@ -0,0 +1,13 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# config is loaded on import and requires Reddit credentials
+os.environ.setdefault("REDDIT_CLIENT_ID", "test")
+os.environ.setdefault("REDDIT_CLIENT_SECRET", "test")
+os.environ.setdefault("REDDIT_USERNAME", "test")
+os.environ.setdefault("REDDIT_PASSWORD", "test")
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="steam-mentions-test-"))
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,50 @@
+import threading
+import time
+
+import pytest
+
+import app as backend
+
+@pytest.fixture
+def client():
+    return backend.app.test_client()
+
+@pytest.mark.parametrize('suggestions', ['abc', None, [3]])
+def test_search_game_rejects_bad_suggestion_count(client, suggestions):
+    response = client.post('/api/search-game', json={'game_name': 'Hades', 'suggestions': suggestions})
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'suggestions must be an integer'}
+
+def test_search_game_requires_game_name_first(client):
+    response = client.post('/api/search-game', json={'suggestions': 'abc'})
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'game_name is required'}
+
+def test_open_streams_leave_job_workers_free(monkeypatch):
+    release = threading.Event()
+
+    def slow_collection(**params):
+        release.wait(5)
+        return {'success': True}
+
+    def listen(game_name):
+        # Reads until the stream ends, like a browser keeping it open
+        backend.app.test_client().get('/api/collect-data/stream', query_string={'game_name': game_name}).get_data()
+
+    monkeypatch.setattr(backend, 'cached_collection', slow_collection)
+    listeners = [threading.Thread(target=listen, args=(f'Game {i}',)) for i in range(backend.config.job_workers)]
+    for listener in listeners:
+        listener.start()
+    try:
+        deadline = time.monotonic() + 5
+        while backend.stream_queue.stats()['running'] < len(listeners) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        job = backend.job_queue.submit('test', {}, lambda: 'done')
+        while not job.done and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert job.result == 'done'
+    finally:
+        release.set()
+        for listener in listeners:
+            listener.join()
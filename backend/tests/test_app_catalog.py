@@ -0,0 +1,32 @@
+import pytest
+
+from utils.app_catalog import AppCatalog, title_numbers
+
+APPS = [
+    (236430, 'DARK SOULS™ II'),
+    (374320, 'DARK SOULS™ III'),
+    (271590, 'Grand Theft Auto V'),
+    (12210, 'Grand Theft Auto IV'),
+    (220240, 'Far Cry 3'),
+    (298110, 'Far Cry 4'),
+    (400, 'Portal'),
+    (620, 'Portal 2'),
+    (1145360, 'Hades'),
+]
+
+@pytest.fixture(scope='module')
+def catalog(tmp_path_factory):
+    return AppCatalog.build(APPS, tmp_path_factory.mktemp('catalog') / 'app_catalog')
+
+def test_title_numbers_read_roman_numerals():
+    assert title_numbers('dark souls iii') == title_numbers('dark souls 3') == {3}
+    assert title_numbers('grand theft auto vi') == {6}
+    assert title_numbers('hades') == frozenset()
+
+@pytest.mark.parametrize('query', ['Dark Souls 3', 'Grand Theft Auto VI', 'Far Cry 7', 'Portal 3'])
+def test_fuzzy_match_refuses_a_different_sequel(catalog, query):
+    assert catalog.fuzzy_match(query, min_score=0.8, margin=0.05) is None
+
+def test_fuzzy_match_accepts_typos(catalog):
+    assert catalog.fuzzy_match('Grand Theft Auto 5', min_score=0.8, margin=0.05)[:2] == ('271590', 'Grand Theft Auto V')
+    assert catalog.fuzzy_match('Grand Theft Autto IV', min_score=0.8, margin=0.05)[:2] == ('12210', 'Grand Theft Auto IV')
@@ -0,0 +1,92 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from scrapers.reddit_client import RedditClient
+from utils.mention_store import MentionStore
+
+HOUR = 3600.0
+
+class FakeSubreddit:
+    """Search listing over a shared list of posts, newest first"""
+
+    def __init__(self, posts):
+        self.posts = posts
+
+    def search(self, query, limit, sort):
+        yield from sorted(self.posts, key=lambda post: -post.created_utc)[:limit]
+
+def post(post_id, created_utc):
+    return SimpleNamespace(
+        id=post_id,
+        title=f"Post {post_id}",
+        subreddit=SimpleNamespace(display_name="gaming"),
+        author="someone",
+        created_utc=created_utc,
+        score=1,
+        num_comments=0,
+        url=f"https://reddit.com/{post_id}"
+    )
+
+@pytest.fixture
+def posts():
+    now = time.time()
+    # One post an hour, from 5 hours ago back to 35 hours ago
+    return [post(f"old{i}", now - (i + 5) * HOUR) for i in range(30)]
+
+@pytest.fixture
+def client(tmp_path, posts):
+    # Skip __init__: no credentials or connection check, just the search machinery
+    client = object.__new__(RedditClient)
+    client._executor = ThreadPoolExecutor(max_workers=2)
+    client.store = MentionStore(tmp_path / "mentions.db")
+    client.last_search_stats = []
+    client.page_totals = {'searches': 0, 'pages_fetched': 0, 'pages_needed': 0, 'early_stops': 0}
+    client._stats_lock = threading.Lock()
+    client._thread_reddit = lambda: SimpleNamespace(subreddit=lambda name: FakeSubreddit(posts))
+    yield client
+    client.close()
+    client.store.close()
+
+def search(client, limit):
+    return client.search_game_mentions("Hades", days=2, subreddits=["gaming"], limit=limit)
+
+def test_capped_search_only_covers_back_to_oldest_post(client, posts):
+    capped = search(client, limit=10)
+    assert len(capped) == 10
+
+    # The window isn't covered, so the next search goes all the way back
+    # instead of only fetching posts newer than the high-water mark
+    refreshed = search(client, limit=1000)
+    assert {mention.id for mention in refreshed} == {p.id for p in posts}
+
+def test_capped_incremental_search_does_not_bridge_the_gap(client, posts):
+    assert len(search(client, limit=1000)) == 30
+
+    # More new posts than one capped search can reach, spread wider than
+    # the high-water overlap
+    now = time.time()
+    posts.extend(post(f"new{i}", now - (i + 0.5) * 10 * 60) for i in range(20))
+    assert len(search(client, limit=10)) == 40
+
+    # Posts between the capped search's oldest post and the old
+    # high-water mark were never fetched, so the next search fills them in
+    refreshed = search(client, limit=1000)
+    assert {mention.id for mention in refreshed} == {p.id for p in posts}
+
+def test_progress_callbacks_add_up_to_the_result(client, posts):
+    search(client, limit=1000)
+
+    now = time.time()
+    posts.extend(post(f"new{i}", now - (i + 0.5) * 60) for i in range(5))
+    reported = []
+    result = client.search_game_mentions(
+        "Hades", days=2, subreddits=["gaming"],
+        on_query_done=lambda stats, new_mentions: reported.extend(new_mentions)
+    )
+
+    # Stored history is reported once, and each new post once
+    assert sorted(mention.id for mention in reported) == sorted(mention.id for mention in result)
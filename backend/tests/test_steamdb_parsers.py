@@ -0,0 +1,20 @@
+import pytest
+
+from scrapers.steamdb_parsers import PARSERS, SteamDBParser, get_parser
+
+def test_base_parser_cannot_be_created():
+    with pytest.raises(TypeError):
+        SteamDBParser()
+
+def test_incomplete_backend_fails_when_created():
+    class SearchOnly(SteamDBParser):
+        def parse_search_result(self, content):
+            return None
+
+    with pytest.raises(TypeError):
+        SearchOnly()
+
+@pytest.mark.parametrize('name', sorted(PARSERS))
+def test_registered_backends_parse_a_follower_label(name):
+    page = b'<html><body><table><tr><td>Followers</td><td>1,234,567</td></tr></table></body></html>'
+    assert get_parser(name).parse_follower_count(page) == 1234567
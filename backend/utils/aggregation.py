@@ -0,0 +1,298 @@
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import List, Optional, Union, TYPE_CHECKING
+
+from scrapers.models import MentionBatch, FollowerSeries
+
+if TYPE_CHECKING:
+    from scrapers.models import RedditMention, SteamFollowerData
+
+Mentions = Union[List['RedditMention'], MentionBatch]
+FollowerPoints = Union[List['SteamFollowerData'], FollowerSeries]
+
+# Pure conversion and daily aggregation helpers shared by the scrapers and
+# DataProcessor. Nothing in here touches config, the network or a client
+# instance, so it is safe to call from anywhere.
+
+DAILY_MENTION_COLUMNS = ['date', 'mention_count', 'total_score', 'total_comments']
+DAILY_FOLLOWER_COLUMNS = ['date', 'steam_followers']
+MERGED_COLUMNS = ['date', 'steam_followers_count', 'mentions_in_social_media']
+
+
+def _epoch_days(timestamps: np.ndarray) -> np.ndarray:
+    """Days since 1970-01-01 of datetime64 (or int64 epoch-second) values, as int64"""
+    if timestamps.dtype.kind in 'iu':
+        return timestamps // 86400
+    return timestamps.astype('datetime64[D]').astype(np.int64)
+
+
+def _days(timestamps: np.ndarray) -> np.ndarray:
+    """Calendar day of each datetime64 (or int64 epoch-second) value, vectorized"""
+    return _epoch_days(timestamps).astype('datetime64[D]').astype('datetime64[s]')
+
+
+@dataclass
+class DailyMentionTotals:
+    """Dense per-day mention totals; index i is day start_day + i"""
+    start_day: int  # Days since 1970-01-01 (UTC)
+    mention_count: np.ndarray  # int64
+    total_score: np.ndarray  # int64
+    total_comments: np.ndarray  # int64
+
+    @property
+    def dates(self) -> np.ndarray:
+        return np.arange(self.start_day, self.start_day + len(self.mention_count)).astype('datetime64[D]')
+
+
+@dataclass
+class DailyFollowerCounts:
+    """Dense last-follower-count-per-day; index i is day start_day + i"""
+    start_day: int  # Days since 1970-01-01
+    steam_followers: np.ndarray  # int64, 0 where observed is False
+    observed: np.ndarray  # bool, True on days with at least one point
+
+    @property
+    def dates(self) -> np.ndarray:
+        return np.arange(self.start_day, self.start_day + len(self.observed)).astype('datetime64[D]')
+
+
+def _window(day_numbers: np.ndarray, start_day: Optional[int], days: Optional[int]):
+    """Resolve a window (defaulting to the data's span) and each row's offset into it"""
+    if start_day is None:
+        start_day = int(day_numbers.min()) if len(day_numbers) else 0
+    if days is None:
+        days = int(day_numbers.max()) - start_day + 1 if len(day_numbers) else 0
+    offsets = day_numbers - start_day
+    inside = (offsets >= 0) & (offsets < days)
+    return start_day, max(days, 0), offsets, inside
+
+
+def daily_mention_totals(
+    mentions: Mentions,
+    start_day: Optional[int] = None,
+    days: Optional[int] = None
+) -> DailyMentionTotals:
+    """
+    Count mentions and sum scores and comments per UTC day with np.bincount
+
+    Args:
+        mentions: Records or a MentionBatch
+        start_day: First day of the window, in days since 1970-01-01
+            (default: the earliest mention)
+        days: Window length (default: through the latest mention)
+
+    Returns:
+        Dense arrays aligned to the window; mentions outside it are ignored
+    """
+    if isinstance(mentions, MentionBatch):
+        created, scores, comments = mentions.created_utc, mentions.scores, mentions.num_comments
+    else:
+        # Only the three numeric fields are needed, not a whole MentionBatch
+        count = len(mentions)
+        created = np.fromiter((m.created_utc.timestamp() for m in mentions), dtype=np.float64, count=count).astype(np.int64)
+        scores = np.fromiter((m.score for m in mentions), dtype=np.int64, count=count)
+        comments = np.fromiter((m.num_comments for m in mentions), dtype=np.int64, count=count)
+
+    start_day, days, offsets, inside = _window(_epoch_days(created), start_day, days)
+    offsets = offsets[inside]
+
+    def per_day(weights=None):
+        totals = np.bincount(offsets, weights=weights, minlength=days)
+        return totals.astype(np.int64)
+
+    return DailyMentionTotals(
+        start_day=start_day,
+        mention_count=per_day(),
+        total_score=per_day(scores[inside]),
+        total_comments=per_day(comments[inside])
+    )
+
+
+def add_mention_totals(totals: DailyMentionTotals, mentions: Mentions) -> DailyMentionTotals:
+    """
+    Totals with more mentions counted in, for building them up as they arrive
+
+    Only the new mentions are counted; the window grows to fit them.
+    """
+    added = daily_mention_totals(mentions)
+    parts = [part for part in (totals, added) if len(part.mention_count)]
+    if len(parts) < 2:
+        return parts[0] if parts else totals
+
+    start = min(part.start_day for part in parts)
+    end = max(part.start_day + len(part.mention_count) for part in parts)
+    columns = {name: np.zeros(end - start, dtype=np.int64) for name in ('mention_count', 'total_score', 'total_comments')}
+    for part in parts:
+        offset = part.start_day - start
+        for name, column in columns.items():
+            values = getattr(part, name)
+            column[offset:offset + len(values)] += values
+    return DailyMentionTotals(start_day=start, **columns)
+
+
+def daily_follower_counts(
+    data: FollowerPoints,
+    start_day: Optional[int] = None,
+    days: Optional[int] = None
+) -> DailyFollowerCounts:
+    """
+    Last follower count of each day (in input order), as dense arrays
+
+    Args:
+        data: Records or a FollowerSeries
+        start_day: First day of the window, in days since 1970-01-01
+            (default: the earliest point)
+        days: Window length (default: through the latest point)
+    """
+    _, _, dates, counts, _ = _follower_columns(data)
+    start_day, days, offsets, inside = _window(_epoch_days(dates), start_day, days)
+
+    # Highest row index per day is the day's last point
+    last_row = np.full(days, -1, dtype=np.int64)
+    np.maximum.at(last_row, offsets[inside], np.flatnonzero(inside))
+    observed = last_row >= 0
+
+    followers = np.zeros(days, dtype=np.int64)
+    followers[observed] = counts[last_row[observed]]
+    return DailyFollowerCounts(start_day=start_day, steam_followers=followers, observed=observed)
+
+
+def mentions_to_dataframe(mentions: Mentions) -> pd.DataFrame:
+    """
+    Convert mentions (records or a MentionBatch) to pandas DataFrame
+
+    Columns are built directly from arrays: `date` is the UTC calendar day
+    as datetime64, and `subreddit`/`author` are categoricals wrapping the
+    batch's string tables without copying.
+    """
+    batch = mentions if isinstance(mentions, MentionBatch) else MentionBatch.from_mentions(mentions)
+
+    return pd.DataFrame({
+        'id': batch.ids,
+        'title': batch.titles,
+        'subreddit': pd.Categorical.from_codes(batch.subreddit_codes, categories=batch.subreddits),
+        'author': pd.Categorical.from_codes(batch.author_codes, categories=batch.authors),
+        'created_utc': pd.to_datetime(batch.created_utc, unit='s', utc=True),
+        'date': _days(batch.created_utc),
+        'score': batch.scores,
+        'num_comments': batch.num_comments,
+        'url': batch.urls
+    })
+
+
+def get_daily_mention_counts(mentions: Mentions) -> pd.DataFrame:
+    """
+    Aggregate mentions by date
+
+    Returns:
+        DataFrame with columns: date, mention_count, total_score, total_comments
+    """
+    totals = daily_mention_totals(mentions)
+    active = np.flatnonzero(totals.mention_count)
+
+    if not len(active):
+        return pd.DataFrame(columns=DAILY_MENTION_COLUMNS)
+
+    return pd.DataFrame({
+        'date': totals.dates[active].astype('datetime64[s]'),
+        'mention_count': totals.mention_count[active],
+        'total_score': totals.total_score[active],
+        'total_comments': totals.total_comments[active]
+    })
+
+
+def _follower_columns(data: FollowerPoints):
+    """(app_ids, game_names, datetime64 dates, int64 counts, sources) of follower data"""
+    if isinstance(data, FollowerSeries):
+        return data.app_id, data.game_name, data.dates, data.follower_counts, data.sources
+    if not len(data):
+        return [], [], np.zeros(0, dtype='datetime64[us]'), np.zeros(0, dtype=np.int64), []
+
+    # DatetimeIndex parses datetime objects far faster than np.array(..., 'datetime64')
+    return (
+        [item.app_id for item in data],
+        [item.game_name for item in data],
+        pd.DatetimeIndex([item.date for item in data]).values,
+        np.fromiter((item.follower_count for item in data), dtype=np.int64, count=len(data)),
+        [item.source for item in data]
+    )
+
+
+def follower_data_to_dataframe(data: FollowerPoints) -> pd.DataFrame:
+    """
+    Convert follower data (records or a FollowerSeries) to pandas DataFrame
+
+    `date` is the calendar day as datetime64 and `source` is categorical.
+    """
+    if not len(data):
+        return pd.DataFrame()
+
+    app_ids, game_names, dates, counts, sources = _follower_columns(data)
+    return pd.DataFrame({
+        'app_id': app_ids,
+        'game_name': game_names,
+        'date': _days(dates),
+        'follower_count': counts,
+        'source': pd.Categorical(sources)
+    })
+
+
+def get_daily_follower_counts(data: FollowerPoints) -> pd.DataFrame:
+    """
+    Process follower data to get daily counts
+
+    Args:
+        data: List of SteamFollowerData objects or a FollowerSeries
+
+    Returns:
+        DataFrame with columns: date, steam_followers
+    """
+    daily = daily_follower_counts(data)
+
+    if not daily.observed.any():
+        return pd.DataFrame(columns=DAILY_FOLLOWER_COLUMNS)
+
+    # Latest follower count for each day, oldest day first
+    return pd.DataFrame({
+        'date': daily.dates[daily.observed].astype('datetime64[s]'),
+        'steam_followers': daily.steam_followers[daily.observed]
+    })
+
+
+def merge_daily(followers: DailyFollowerCounts, mentions: DailyMentionTotals) -> pd.DataFrame:
+    """
+    Lay daily follower counts and mention counts on one shared day axis
+
+    The axis runs from the earlier start to the later end of the two
+    windows. Each series is copied into a preallocated column at its
+    offset, and days a series doesn't cover stay 0.
+
+    Returns:
+        DataFrame with columns: date (datetime.date), steam_followers_count,
+        mentions_in_social_media
+    """
+    spans = [
+        (series.start_day, values)
+        for series, values in ((followers, followers.steam_followers), (mentions, mentions.mention_count))
+        if len(values)
+    ]
+    if not spans:
+        return pd.DataFrame(columns=MERGED_COLUMNS)
+
+    start = min(start_day for start_day, _ in spans)
+    end = max(start_day + len(values) for start_day, values in spans)
+
+    columns = {}
+    for name, (start_day, values) in zip(MERGED_COLUMNS[1:], [
+        (followers.start_day, followers.steam_followers),
+        (mentions.start_day, mentions.mention_count)
+    ]):
+        column = np.zeros(end - start, dtype=np.int64)
+        column[start_day - start:start_day - start + len(values)] = values
+        columns[name] = column
+
+    return pd.DataFrame({
+        'date': np.arange(start, end).astype('datetime64[D]').astype(object),
+        **columns
+    })
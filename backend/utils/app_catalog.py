@@ -0,0 +1,395 @@
+import bisect
+import json
+import mmap
+import os
+import re
+import shutil
+import tempfile
+import unicodedata
+import uuid
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.fuzzy_match import TRIGRAM_FILES, TrigramIndex, write_trigram_index
+
+logger = logging.getLogger(__name__)
+
+# Files making up a built catalog directory
+CATALOG_FILES = (
+    'app_ids.npy', 'row_by_app_id.npy', 'name_offsets.npy', 'names.bin',
+    'norm_offsets.npy', 'norm_names.bin',
+    'token_offsets.npy', 'tokens.bin', 'posting_offsets.npy', 'postings.npy',
+) + TRIGRAM_FILES
+
+# Written last into a finished build; a directory without it is never opened
+COMPLETE_MARKER = 'COMPLETE'
+
+_DROPPED = re.compile(r"['’`®™©]")
+_SEPARATORS = re.compile(r'[^0-9a-z]+')
+_ROMAN = re.compile(r'^x{0,3}(ix|iv|v?i{0,3})$')
+_ROMAN_VALUES = {'i': 1, 'v': 5, 'x': 10}
+
+def normalize_name(name: str) -> str:
+    """
+    Lowercase ASCII form of a title used for matching
+
+    "Baldur's Gate 3", "BALDUR’S GATE™ 3" and "baldurs gate 3" all
+    normalize to "baldurs gate 3".
+    """
+    name = _DROPPED.sub('', name.lower())
+    name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode()
+    return _SEPARATORS.sub(' ', name).strip()
+
+def title_numbers(normalized: str) -> frozenset:
+    """
+    Numbers in a normalized title, with roman numerals read as integers
+
+    "dark souls 3" and "dark souls iii" both give {3}, "far cry 4" gives {4}.
+    """
+    # Digit runs count inside words too ("dota2")
+    numbers = {int(digits) for digits in re.findall(r'\d+', normalized)}
+    for token in normalized.split():
+        if _ROMAN.match(token):
+            values = [_ROMAN_VALUES[c] for c in token]
+            # A smaller numeral before a larger one is subtracted (iv, ix)
+            numbers.add(sum(-v if v < after else v for v, after in zip(values, values[1:] + [0])))
+    return frozenset(numbers)
+
+def load_app_list(path: Path) -> List[Tuple[int, str]]:
+    """
+    Read a Steam app list dump
+
+    Accepts the ISteamApps/GetAppList/v2 response ({"applist": {"apps": [...]}})
+    or a bare list of {"appid", "name"} objects.
+    """
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get('applist', data).get('apps', [])
+    # Some dumps carry "name": null for delisted apps
+    return [(int(app['appid']), app['name']) for app in data if (app.get('name') or '').strip()]
+
+class _BlobStrings:
+    """Sequence view of strings stored as one UTF-8 blob plus offsets"""
+
+    def __init__(self, blob, offsets: np.ndarray):
+        self.blob = blob
+        self.offsets = offsets
+        # memoryview indexing yields plain ints, much cheaper than numpy scalars
+        self._bounds = memoryview(offsets) if len(offsets) else [0]
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> bytes:
+        return self.blob[self._bounds[i]:self._bounds[i + 1]]
+
+def _write_blob(blob_path: Path, offsets_path: Path, values: List[bytes]):
+    offsets = np.zeros(len(values) + 1, dtype=np.int64)
+    np.cumsum([len(v) for v in values], out=offsets[1:])
+    blob_path.write_bytes(b''.join(values))
+    np.save(offsets_path, offsets)
+
+@contextmanager
+def _build_lock(directory: Path):
+    """Exclusive lock on a catalog directory, across threads and processes"""
+    lock_path = directory.with_name(f".{directory.name}.lock")
+    with open(lock_path, 'a+b') as f:
+        if os.name == 'nt':
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if os.name == 'nt':
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+def _replace_directory(source: Path, target: Path):
+    """Move a finished build over target, removing the build it replaces"""
+    # os.replace can't overwrite a non-empty directory, so the old build is
+    # renamed aside first. Open catalogs keep their mappings of its files.
+    retired = None
+    if target.exists():
+        retired = target.with_name(f".{target.name}.old-{uuid.uuid4().hex[:8]}")
+        os.replace(target, retired)
+    os.replace(source, target)
+    if retired is not None:
+        shutil.rmtree(retired, ignore_errors=True)
+
+def _map_blob(path: Path):
+    # mmap refuses empty files
+    if not path.stat().st_size:
+        return b''
+    with open(path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+class AppCatalog:
+    """
+    Memory-mapped index of the Steam app list
+
+    Apps are stored sorted by normalized name (ties by app_id), so exact
+    and prefix lookups are binary searches over the mapped name blob. A
+    token index maps every word to the rows containing it, and a trigram
+    index backs fuzzy matching. A dense table indexed by app_id gives the
+    row of any app in one array read. Nothing is loaded into Python
+    objects until a row is returned.
+    """
+
+    def __init__(self, directory: Path):
+        """
+        Args:
+            directory: Directory written by AppCatalog.build
+
+        Raises:
+            FileNotFoundError: If the directory isn't a complete build
+        """
+        self.directory = Path(directory)
+        if not (self.directory / COMPLETE_MARKER).exists():
+            raise FileNotFoundError(f"No complete app catalog in {self.directory}")
+        load = lambda name: np.load(self.directory / name, mmap_mode='r')
+
+        self.app_ids = load('app_ids.npy')
+        self._row_by_app_id = load('row_by_app_id.npy')
+        self._names = _BlobStrings(_map_blob(self.directory / 'names.bin'), load('name_offsets.npy'))
+        self._norm_names = _BlobStrings(_map_blob(self.directory / 'norm_names.bin'), load('norm_offsets.npy'))
+        self._tokens = _BlobStrings(_map_blob(self.directory / 'tokens.bin'), load('token_offsets.npy'))
+        self._posting_offsets = load('posting_offsets.npy')
+        self._postings = load('postings.npy')
+        self._trigrams = TrigramIndex(self.directory, self._norm_names)
+
+    @classmethod
+    def build(cls, apps: Iterable[Tuple[int, str]], directory: Path) -> 'AppCatalog':
+        """
+        Build the catalog files from (app_id, name) pairs and open them
+
+        The files are written to a staging directory next to the output
+        and swapped into place once complete, so a catalog that is open
+        (and memory-mapped) elsewhere is never written over.
+
+        Args:
+            apps: Pairs such as those returned by load_app_list
+            directory: Output directory (replaced if it exists)
+        """
+        directory = Path(directory)
+        directory.parent.mkdir(parents=True, exist_ok=True)
+        with _build_lock(directory):
+            cls._build(apps, directory)
+        return cls(directory)
+
+    @classmethod
+    def _build(cls, apps: Iterable[Tuple[int, str]], target: Path):
+        # Caller holds the build lock, so any staging or retired
+        # directory left next to the target is from a crashed build
+        for leftover in target.parent.glob(f".{target.name}.*-*"):
+            shutil.rmtree(leftover, ignore_errors=True)
+        directory = Path(tempfile.mkdtemp(prefix=f".{target.name}.build-", dir=target.parent))
+
+        try:
+            count, token_count = cls._write_files(apps, directory)
+            (directory / COMPLETE_MARKER).write_text(f"{count}\n")
+            _replace_directory(directory, target)
+        except BaseException:
+            shutil.rmtree(directory, ignore_errors=True)
+            raise
+
+        logger.info(f"Built Steam app catalog with {count} apps and {token_count} tokens in {target}")
+
+    @staticmethod
+    def _write_files(apps: Iterable[Tuple[int, str]], directory: Path) -> Tuple[int, int]:
+        rows = sorted(
+            (normalize_name(name).encode(), app_id, name.strip().encode())
+            for app_id, name in apps
+        )
+        rows = [row for row in rows if row[0]]
+
+        app_ids = np.array([row[1] for row in rows], dtype=np.uint32)
+        np.save(directory / 'app_ids.npy', app_ids)
+        # Steam app IDs are dense enough (a few million) for a direct table;
+        # assigning in reverse leaves the first row of a duplicated app_id
+        row_by_app_id = np.full(int(app_ids.max()) + 1 if len(app_ids) else 0, -1, dtype=np.int32)
+        row_by_app_id[app_ids[::-1]] = np.arange(len(app_ids) - 1, -1, -1, dtype=np.int32)
+        np.save(directory / 'row_by_app_id.npy', row_by_app_id)
+        _write_blob(directory / 'names.bin', directory / 'name_offsets.npy', [row[2] for row in rows])
+        _write_blob(directory / 'norm_names.bin', directory / 'norm_offsets.npy', [row[0] for row in rows])
+
+        postings = {}
+        for row_index, row in enumerate(rows):
+            for token in set(row[0].split()):
+                postings.setdefault(token, []).append(row_index)
+        tokens = sorted(postings)
+        _write_blob(directory / 'tokens.bin', directory / 'token_offsets.npy', tokens)
+        posting_offsets = np.zeros(len(tokens) + 1, dtype=np.int64)
+        np.cumsum([len(postings[t]) for t in tokens], out=posting_offsets[1:])
+        np.save(directory / 'posting_offsets.npy', posting_offsets)
+        np.save(directory / 'postings.npy', np.array(
+            [row_index for t in tokens for row_index in postings[t]], dtype=np.uint32
+        ))
+        write_trigram_index(directory, [row[0] for row in rows])
+        return len(rows), len(tokens)
+
+    @classmethod
+    def open_or_build(cls, app_list_path: Path, directory: Path) -> Optional['AppCatalog']:
+        """
+        Open the catalog, rebuilding it first if the app list dump is newer
+
+        Holds the build lock while checking, so concurrent workers build
+        once and the others open the result.
+
+        Returns:
+            The catalog, or None if neither a built catalog nor a dump exists
+        """
+        app_list_path, directory = Path(app_list_path), Path(directory)
+        directory.parent.mkdir(parents=True, exist_ok=True)
+        marker = directory / COMPLETE_MARKER
+
+        with _build_lock(directory):
+            built = marker.exists() and all((directory / name).exists() for name in CATALOG_FILES)
+            if app_list_path.exists():
+                built_at = marker.stat().st_mtime if built else 0
+                if app_list_path.stat().st_mtime > built_at:
+                    cls._build(load_app_list(app_list_path), directory)
+                    built = True
+
+        return cls(directory) if built else None
+
+    def __len__(self) -> int:
+        return len(self.app_ids)
+
+    def row(self, index: int) -> Tuple[str, str]:
+        """(app_id, name) stored at a row"""
+        return str(int(self.app_ids[index])), self._names[index].decode()
+
+    def _rows_for(self, app_ids: Sequence[str]) -> np.ndarray:
+        ids = np.array([int(a) if str(a).isdigit() else -1 for a in app_ids], dtype=np.int64)
+        rows = np.full(len(ids), -1, dtype=np.int64)
+        known = (ids >= 0) & (ids < len(self._row_by_app_id))
+        rows[known] = self._row_by_app_id[ids[known]]
+        return rows
+
+    def name_for(self, app_id: str) -> Optional[str]:
+        """Catalog name of an app, or None if it isn't in the catalog"""
+        app_id = str(app_id)
+        if not app_id.isdigit() or int(app_id) >= len(self._row_by_app_id):
+            return None
+        row = int(self._row_by_app_id[int(app_id)])
+        return self._names[row].decode() if row >= 0 else None
+
+    def names_for(self, app_ids: Sequence[str]) -> List[Optional[str]]:
+        """Catalog names for many app IDs at once (None where unknown)"""
+        return [self._names[row].decode() if row >= 0 else None for row in self._rows_for(app_ids).tolist()]
+
+    def lookup(self, name: str) -> Optional[Tuple[str, str]]:
+        """
+        Exact match on the normalized name
+
+        Returns:
+            Tuple of (app_id, catalog name) of the lowest matching app_id, or None
+        """
+        key = normalize_name(name).encode()
+        index = bisect.bisect_left(self._norm_names, key)
+        if key and index < len(self) and self._norm_names[index] == key:
+            return self.row(index)
+        return None
+
+    def prefix(self, prefix: str, limit: int = 10) -> List[Tuple[str, str]]:
+        """Apps whose normalized name starts with prefix, in name order"""
+        key = normalize_name(prefix).encode()
+        if not key:
+            return []
+
+        results = []
+        index = bisect.bisect_left(self._norm_names, key)
+        while index < len(self) and len(results) < limit and self._norm_names[index].startswith(key):
+            results.append(self.row(index))
+            index += 1
+        return results
+
+    def _posting(self, token: bytes) -> np.ndarray:
+        index = bisect.bisect_left(self._tokens, token)
+        if index < len(self._tokens) and self._tokens[index] == token:
+            return self._postings[self._posting_offsets[index]:self._posting_offsets[index + 1]]
+        return np.zeros(0, dtype=np.uint32)
+
+    def search_tokens(self, query: str, limit: int = 10) -> List[Tuple[str, str]]:
+        """
+        Apps containing every word of the query, shortest names first
+
+        Word order doesn't matter, so "witcher 3" finds "The Witcher 3: Wild Hunt".
+        """
+        tokens = sorted(set(normalize_name(query).encode().split()))
+        if not tokens:
+            return []
+
+        postings = sorted((self._posting(token) for token in tokens), key=len)
+        rows = postings[0]
+        for posting in postings[1:]:
+            if not len(rows):
+                break
+            rows = np.intersect1d(rows, posting, assume_unique=True)
+
+        offsets = self._norm_names.offsets
+        lengths = offsets[rows.astype(np.int64) + 1] - offsets[rows]
+        best = rows[np.argsort(lengths, kind='stable')[:limit]]
+        return [self.row(int(index)) for index in best]
+
+    def fuzzy(self, query: str, limit: int = 10) -> List[Tuple[str, str, float]]:
+        """
+        Apps whose names are closest to the query, tolerating typos
+
+        Returns:
+            (app_id, name, score) tuples, best first; an exact normalized
+            match scores 1.0
+        """
+        key = normalize_name(query).encode()
+        if not key:
+            return []
+        return [(*self.row(index), score) for index, score in self._trigrams.search(key, limit)]
+
+    def fuzzy_match(self, query: str, min_score: float, margin: float, candidates: int = 5) -> Optional[Tuple[str, str, float]]:
+        """
+        The fuzzy match to accept without asking, if there is a clear one
+
+        Typos are forgiven but numbers aren't: candidates whose numbers
+        (digits or roman numerals) differ from the query's are dropped, so
+        "Portal 3" never resolves to Portal 2. What remains must score at
+        least min_score and beat the runner-up by at least margin.
+
+        Returns:
+            (app_id, name, score) of the match, or None if it's ambiguous
+        """
+        numbers = title_numbers(normalize_name(query))
+        ranked = [
+            candidate for candidate in self.fuzzy(query, limit=candidates)
+            if title_numbers(normalize_name(candidate[1])) == numbers
+        ]
+        if not ranked or ranked[0][2] < min_score:
+            return None
+        if len(ranked) > 1 and ranked[0][2] - ranked[1][2] < margin:
+            return None
+        return ranked[0]
+
+if __name__ == '__main__':
+    import argparse
+    import sys
+    import time
+
+    parser = argparse.ArgumentParser(description="Build the local Steam app catalog from an app list dump")
+    parser.add_argument('app_list', help="JSON from https://api.steampowered.com/ISteamApps/GetAppList/v2/")
+    parser.add_argument('directory', help="Output directory, e.g. data/app_catalog")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+    start = time.perf_counter()
+    catalog = AppCatalog.build(load_app_list(Path(args.app_list)), Path(args.directory))
+    print(f"{len(catalog)} apps indexed in {time.perf_counter() - start:.1f}s")
@@ -0,0 +1,124 @@
+import threading
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from utils.app_catalog import AppCatalog, normalize_name
+
+logger = logging.getLogger(__name__)
+
+# Games known without a catalog: (app_id, display name, extra names it's searched by)
+BUILTIN_APPS = [
+    ('1091500', 'Cyberpunk 2077', ()),
+    ('292030', 'The Witcher 3: Wild Hunt', ('The Witcher 3',)),
+    ('1245620', 'Elden Ring', ()),
+    ('1086940', "Baldur's Gate 3", ()),
+    ('730', 'Counter-Strike 2', ()),
+    ('570', 'Dota 2', ()),
+    ('271590', 'Grand Theft Auto V', ()),
+    ('1174180', 'Red Dead Redemption 2', ()),
+    ('377160', 'Fallout 4', ()),
+    ('489830', 'The Elder Scrolls V: Skyrim Special Edition', ('Skyrim',)),
+]
+
+class AppRegistry:
+    """
+    Bidirectional game name <-> app_id lookups
+
+    Built-in games and names learned at runtime (e.g. from SteamDB
+    searches) live in two dicts; anything else is answered by the app
+    catalog, whose app_id table and sorted names are memory-mapped. The
+    catalog is opened once per process however many scrapers ask for it.
+    """
+
+    def __init__(self, builtin: Iterable[Tuple[str, str, Sequence[str]]] = BUILTIN_APPS):
+        """
+        Args:
+            builtin: (app_id, display name, aliases) entries known up front
+        """
+        self._names: Dict[str, str] = {}  # app_id -> display name
+        self._ids: Dict[str, str] = {}  # normalized name -> app_id
+        self._lock = threading.Lock()
+        self._catalog: Optional[AppCatalog] = None
+        self._catalog_loaded = False
+
+        for app_id, name, aliases in builtin:
+            self.add(app_id, name, aliases)
+
+    @property
+    def catalog(self) -> Optional[AppCatalog]:
+        return self._catalog
+
+    def load_catalog(self, app_list_path: Path, directory: Path) -> Optional[AppCatalog]:
+        """
+        Open (or rebuild) the app catalog the first time it's requested
+
+        Later calls return the same catalog. A catalog that fails to load
+        is logged and the registry keeps working from its dicts.
+        """
+        with self._lock:
+            if not self._catalog_loaded:
+                try:
+                    self._catalog = AppCatalog.open_or_build(app_list_path, directory)
+                except Exception as e:
+                    logger.warning(f"Could not load Steam app catalog: {e}")
+                if self._catalog is None:
+                    logger.info(f"No Steam app catalog, save the app list to {app_list_path} to enable offline lookups")
+                self._catalog_loaded = True
+            return self._catalog
+
+    def add(self, app_id: str, name: str, aliases: Sequence[str] = ()):
+        """Remember a game so both directions resolve without the catalog"""
+        with self._lock:
+            self._names.setdefault(app_id, name)
+            for alias in (name, *aliases):
+                key = normalize_name(alias)
+                if key:
+                    self._ids.setdefault(key, app_id)
+
+    def app_id(self, name: str) -> Optional[Tuple[str, str]]:
+        """
+        Exact (normalized) name lookup
+
+        Built-in games, their aliases and names learned at runtime are a
+        dict hit and keep the name as given, since callers search Reddit
+        and key stored mentions by it ("Skyrim" stays "Skyrim"). Other
+        names are a binary search over the catalog's sorted names
+        (O(log n), not a hash lookup) and resolve to the store name.
+
+        Returns:
+            Tuple of (app_id, name), or None if unknown
+        """
+        app_id = self._ids.get(normalize_name(name))
+        if app_id is not None:
+            return app_id, name
+        if self._catalog is not None:
+            return self._catalog.lookup(name)
+        return None
+
+    def name(self, app_id: str) -> Optional[str]:
+        """Display name of an app, or None if unknown"""
+        name = self._names.get(app_id)
+        if name is None and self._catalog is not None:
+            name = self._catalog.name_for(app_id)
+        return name
+
+    def names(self, app_ids: Sequence[str]) -> List[Optional[str]]:
+        """
+        Display names for many app IDs at once
+
+        Dict hits are resolved directly and the rest go to the catalog in
+        a single vectorized lookup.
+
+        Returns:
+            Names in the same order as app_ids, None where unknown
+        """
+        names = [self._names.get(app_id) for app_id in app_ids]
+        missing = [i for i, name in enumerate(names) if name is None]
+        if missing and self._catalog is not None:
+            for i, name in zip(missing, self._catalog.names_for([app_ids[i] for i in missing])):
+                names[i] = name
+        return names
+
+# Shared instance used by every scraper in the process
+app_registry = AppRegistry()
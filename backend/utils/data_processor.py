@@ -1,12 +1,15 @@
 import pandas as pd
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import logging
 from pathlib import Path
 
-from scrapers.reddit_client import RedditMention, RedditClient
-from scrapers.stream_scraper import SteamFollowerData, SteamDBScraper
+from scrapers.reddit_client import RedditMention
+from scrapers.stream_scraper import SteamFollowerData
+from scrapers.models import FollowerSeries
 from config import config
+from utils import aggregation, exporters
+from utils.raw_data_lake import RawDataLake
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +20,7 @@ class DataProcessor:
         """Initialize the data processor"""
         self.data_dir = Path(config.data_dir)
         self.data_dir.mkdir(exist_ok=True)
+        self.raw_data = RawDataLake(self.data_dir / 'raw')
         
     def merge_steam_reddit_data(
         self, 
@@ -35,105 +39,77 @@ class DataProcessor:
         """
         logger.info("Merging Steam and Reddit data")
         
-        # Convert to DataFrames
-        steam_scraper = SteamDBScraper()
-        reddit_client = RedditClient()
+        # Dense per-day arrays, aligned on a shared day axis by offset
+        result_df = aggregation.merge_daily(
+            aggregation.daily_follower_counts(steam_data),
+            aggregation.daily_mention_totals(reddit_mentions)
+        )
         
-        steam_df = steam_scraper.get_daily_follower_counts(steam_data)
-        reddit_df = reddit_client.get_daily_mention_counts(reddit_mentions)
-        
-        # Create date range for the analysis period
-        if steam_df.empty and reddit_df.empty:
+        if result_df.empty:
             logger.warning("No data available for merging")
-            return pd.DataFrame(columns=['date', 'steam_followers_count', 'mentions_in_social_media'])
-        
-        # Determine date range
-        start_date = None
-        end_date = None
-        
-        if not steam_df.empty:
-            steam_dates = pd.to_datetime(steam_df['date'])
-            start_date = steam_dates.min()
-            end_date = steam_dates.max()
-        
-        if not reddit_df.empty:
-            reddit_dates = pd.to_datetime(reddit_df['date'])
-            if start_date is None:
-                start_date = reddit_dates.min()
-                end_date = reddit_dates.max()
-            else:
-                start_date = min(start_date, reddit_dates.min())
-                end_date = max(end_date, reddit_dates.max())
-        
-        if start_date is None:
-            start_date = datetime.now().date() - timedelta(days=30)
-            end_date = datetime.now().date()
-        
-        # Create complete date range
-        date_range = pd.date_range(start=start_date, end=end_date, freq='D')
-        result_df = pd.DataFrame({'date': date_range.date})
-        
-        # Merge Steam data
-        if not steam_df.empty:
-            steam_df['date'] = pd.to_datetime(steam_df['date']).dt.date
-            result_df = result_df.merge(
-                steam_df[['date', 'steam_followers']], 
-                on='date', 
-                how='left'
-            ).rename(columns={'steam_followers': 'steam_followers_count'})
-        else:
-            result_df['steam_followers_count'] = 0
-        
-        # Merge Reddit data
-        if not reddit_df.empty:
-            reddit_df['date'] = pd.to_datetime(reddit_df['date']).dt.date
-            result_df = result_df.merge(
-                reddit_df[['date', 'mention_count']], 
-                on='date', 
-                how='left'
-            ).rename(columns={'mention_count': 'mentions_in_social_media'})
-        else:
-            result_df['mentions_in_social_media'] = 0
-        
-        # Fill missing values
-        result_df['steam_followers_count'] = result_df['steam_followers_count'].fillna(0).astype(int)
-        result_df['mentions_in_social_media'] = result_df['mentions_in_social_media'].fillna(0).astype(int)
-        
-        # Sort by date
-        result_df = result_df.sort_values('date').reset_index(drop=True)
+            return result_df
         
         logger.info(f"Merged data contains {len(result_df)} days")
         return result_df
     
-    def export_to_csv(self, data: pd.DataFrame, filename: str = None) -> str:
+    def iter_export(self, data: pd.DataFrame, fmt: str = 'csv') -> Iterator[bytes]:
         """
-        Export merged data to CSV file
+        Yield merged data in an export format, config.export_chunk_rows rows at a time
+        
+        Args:
+            data: DataFrame with the exporters.EXPORT_COLUMNS
+            fmt: One of exporters.EXPORT_FORMATS (csv, csv.gz, parquet, arrow, ndjson)
+        """
+        return exporters.iter_export(data, fmt, config.export_chunk_rows)
+    
+    def export_filename(self, filename: Optional[str] = None, fmt: str = 'csv') -> str:
+        """Name for an export: the one given (or a timestamped one), with fmt's extension"""
+        # Exports always land directly in data_dir
+        name = Path(filename).name if filename else f"export_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        return exporters.with_extension(name, fmt)
+    
+    def export(self, data: pd.DataFrame, filename: str = None, fmt: str = None) -> str:
+        """
+        Export merged data to a file in data_dir
+        
+        Rows are written in chunks as they are encoded (see iter_export).
         
         Args:
             data: DataFrame to export
             filename: Optional filename, will generate one if not provided
+            fmt: Export format; taken from the filename's extension if not
+                given, CSV if neither says
             
         Returns:
-            Path to the exported CSV file
+            Path to the exported file
+            
+        Raises:
+            ValueError: If fmt isn't a known export format
         """
-        filepath = self.data_dir / filename
-        
-        # Ensure proper column order and formatting
-        export_df = data.copy()
-        
-        # Format date column
-        export_df['date'] = pd.to_datetime(export_df['date']).dt.strftime('%Y-%m-%d')
+        fmt = exporters.format_for(filename, fmt)
+        filepath = self.data_dir / self.export_filename(filename, fmt)
         
-        # Reorder columns to match requirements
-        column_order = ['date', 'steam_followers_count', 'mentions_in_social_media']
-        export_df = export_df[column_order]
-        
-        # Export to CSV
-        export_df.to_csv(filepath, index=False)
+        with open(filepath, 'wb') as f:
+            for piece in self.iter_export(data, fmt):
+                f.write(piece)
         
         logger.info(f"Data exported to {filepath}")
         return str(filepath)
     
+    def export_to_csv(self, data: pd.DataFrame, filename: str = None, gzip: bool = False) -> str:
+        """
+        Export merged data to CSV file
+        
+        Args:
+            data: DataFrame to export
+            filename: Optional filename, will generate one if not provided
+            gzip: Write a gzip-compressed CSV (.csv.gz)
+            
+        Returns:
+            Path to the exported CSV file
+        """
+        return self.export(data, filename, 'csv.gz' if gzip else 'csv')
+    
     def print_comparison_table(self, data: pd.DataFrame, max_rows: int = 50):
         """
         Print comparison table to console
@@ -232,20 +208,30 @@ class DataProcessor:
         
         return stats
     
-    def save_raw_data(self, steam_data: List[SteamFollowerData], reddit_mentions: List[RedditMention]):
-        """Save raw data for future analysis"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    def save_raw_data(
+        self,
+        steam_data: List[SteamFollowerData],
+        reddit_mentions: List[RedditMention],
+        app_id: Optional[str] = None
+    ):
+        """
+        Append raw data to the Parquet lake under data_dir/raw for future analysis
+
+        Args:
+            steam_data: Steam follower data points
+            reddit_mentions: Reddit mentions
+            app_id: Steam App ID the data belongs to (default: taken from steam_data)
+        """
+        if app_id is None and len(steam_data):
+            app_id = steam_data.app_id if isinstance(steam_data, FollowerSeries) else steam_data[0].app_id
+        app_id = str(app_id or 'unknown')
         
         # Save Steam data
-        if steam_data:
-            steam_df = SteamDBScraper().follower_data_to_dataframe(steam_data)
-            steam_path = self.data_dir / f"steam_raw_{timestamp}.csv"
-            steam_df.to_csv(steam_path, index=False)
-            logger.info(f"Raw Steam data saved to {steam_path}")
+        if len(steam_data):
+            rows = self.raw_data.append('steam', app_id, aggregation.follower_data_to_dataframe(steam_data))
+            logger.info(f"{rows} raw Steam rows saved for app {app_id}")
         
         # Save Reddit data
-        if reddit_mentions:
-            reddit_df = RedditClient().mentions_to_dataframe(reddit_mentions)
-            reddit_path = self.data_dir / f"reddit_raw_{timestamp}.csv"
-            reddit_df.to_csv(reddit_path, index=False)
-            logger.info(f"Raw Reddit data saved to {reddit_path}")
+        if len(reddit_mentions):
+            rows = self.raw_data.append('reddit', app_id, aggregation.mentions_to_dataframe(reddit_mentions))
+            logger.info(f"{rows} raw Reddit rows saved for app {app_id}")
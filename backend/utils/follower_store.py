@@ -0,0 +1,135 @@
+import sqlite3
+import threading
+import logging
+from datetime import datetime, date
+from pathlib import Path
+from typing import Dict, Iterable
+
+from scrapers.models import SteamFollowerData, FollowerSeries
+
+logger = logging.getLogger(__name__)
+
+# Only scraped counts are stored; simulated fill-ins are generated at read time
+OBSERVED_SOURCE = 'current'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS follower_snapshots (
+    app_id TEXT NOT NULL,
+    ts REAL NOT NULL,
+    date TEXT NOT NULL,
+    game_name TEXT NOT NULL,
+    follower_count INTEGER NOT NULL,
+    source TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_follower_snapshots_app_date ON follower_snapshots (app_id, date);
+"""
+
+class FollowerStore:
+    """Append-only SQLite store of observed Steam follower snapshots"""
+
+    def __init__(self, db_path: Path):
+        """
+        Args:
+            db_path: SQLite database file (created if missing)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+
+    def append(self, snapshots: Iterable[SteamFollowerData]) -> int:
+        """
+        Append snapshots; existing rows are never updated
+
+        Snapshots that weren't scraped (simulated or historical) are skipped.
+
+        Returns:
+            Number of rows written
+        """
+        rows = [
+            (s.app_id, s.date.timestamp(), s.date.date().isoformat(), s.game_name, s.follower_count, s.source)
+            for s in snapshots
+            if s.source == OBSERVED_SOURCE
+        ]
+        if not rows:
+            return 0
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO follower_snapshots (app_id, ts, date, game_name, follower_count, source) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+        return len(rows)
+
+    def append_series(self, series: FollowerSeries) -> int:
+        """
+        Append a columnar series without building a SteamFollowerData per point
+
+        Like append, only the series' observed points are written.
+
+        Returns:
+            Number of rows written
+        """
+        observed = series.sources == OBSERVED_SOURCE
+        count = int(observed.sum())
+        if not count:
+            return 0
+
+        # Naive datetime64 values are local wall-clock times, like SteamFollowerData.date
+        dates = series.dates[observed]
+        timestamps = [d.timestamp() for d in dates.tolist()]
+        day_strings = dates.astype('datetime64[D]').astype(str).tolist()
+        rows = zip(
+            [series.app_id] * count, timestamps, day_strings,
+            [series.game_name] * count, series.follower_counts[observed].tolist(), series.sources[observed].tolist()
+        )
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO follower_snapshots (app_id, ts, date, game_name, follower_count, source) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+        return count
+
+    def latest_per_day(self, app_id: str, start: date, end: date) -> Dict[date, SteamFollowerData]:
+        """
+        Latest observed snapshot of each day in [start, end] for one app
+
+        Rows simulated into older databases are ignored.
+
+        Returns:
+            Dict mapping each stored date to its latest SteamFollowerData
+        """
+        with self._lock:
+            # SQLite returns the other columns from the row holding MAX(ts)
+            rows = self._conn.execute(
+                """
+                SELECT date, MAX(ts), game_name, follower_count, source
+                FROM follower_snapshots
+                WHERE app_id = ? AND date BETWEEN ? AND ? AND source = ?
+                GROUP BY date
+                ORDER BY date
+                """,
+                (app_id, start.isoformat(), end.isoformat(), OBSERVED_SOURCE)
+            ).fetchall()
+
+        return {
+            date.fromisoformat(row[0]): SteamFollowerData(
+                app_id=app_id,
+                game_name=row[2],
+                date=datetime.fromtimestamp(row[1]),
+                follower_count=row[3],
+                source=row[4]
+            )
+            for row in rows
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
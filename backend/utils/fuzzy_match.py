@@ -0,0 +1,194 @@
+import logging
+import math
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Files making up a trigram index, written next to the catalog files
+TRIGRAM_FILES = ('gram_keys.npy', 'gram_offsets.npy', 'gram_postings.npy', 'gram_counts.npy')
+
+# Fraction of the query's trigrams a name must share to be a candidate
+MIN_SHARED = 0.6
+
+def _padded(norm_name: bytes) -> bytes:
+    # Padding gives word-boundary grams, so short names still have a few
+    return b' ' + norm_name + b' '
+
+def trigram_codes(norm_name: bytes) -> np.ndarray:
+    """
+    Distinct trigrams of a normalized name, packed as 24-bit integers
+
+    Normalized names are ASCII, so three bytes pack losslessly.
+    """
+    buf = np.frombuffer(_padded(norm_name), dtype=np.uint8).astype(np.uint32)
+    if len(buf) < 3:
+        return np.zeros(0, dtype=np.uint32)
+    return np.unique(buf[:-2] << 16 | buf[1:-1] << 8 | buf[2:])
+
+def write_trigram_index(directory: Path, norm_names: Sequence[bytes]):
+    """
+    Write an inverted index from trigram to catalog rows
+
+    Built with numpy over one concatenated buffer, so 150k names index in
+    well under a second.
+    """
+    lengths = np.array([len(name) for name in norm_names], dtype=np.int64)
+    buf = np.frombuffer(b''.join(_padded(name) for name in norm_names), dtype=np.uint8).astype(np.uint32)
+
+    # Every position in the buffer that starts a gram inside its own row:
+    # row r's grams start after the r earlier rows' two padding bytes
+    rows = np.repeat(np.arange(len(lengths), dtype=np.int64), lengths)
+    positions = np.arange(len(rows), dtype=np.int64) + 2 * rows
+    codes = buf[positions] << 16 | buf[positions + 1] << 8 | buf[positions + 2]
+
+    # Distinct (gram, row) pairs, ordered by gram then row
+    # (np.unique hashes large arrays, a plain sort is several times faster)
+    pairs = np.sort(codes.astype(np.uint64) << 32 | rows.astype(np.uint64))
+    pairs = pairs[np.append(True, pairs[1:] != pairs[:-1])]
+    gram_of_pair = (pairs >> 32).astype(np.uint32)
+    row_of_pair = (pairs & 0xFFFFFFFF).astype(np.uint32)
+
+    starts = np.flatnonzero(np.append(True, gram_of_pair[1:] != gram_of_pair[:-1]))
+    keys = gram_of_pair[starts]
+    offsets = np.append(starts, len(pairs)).astype(np.int64)
+
+    np.save(directory / 'gram_keys.npy', keys)
+    np.save(directory / 'gram_offsets.npy', offsets)
+    np.save(directory / 'gram_postings.npy', row_of_pair)
+    np.save(directory / 'gram_counts.npy', np.bincount(row_of_pair, minlength=len(lengths)).astype(np.uint16))
+
+def bounded_levenshtein(a: bytes, b: bytes, max_distance: int) -> Optional[int]:
+    """
+    Edit distance between a and b, or None if it exceeds max_distance
+
+    Only the diagonal band of width 2 * max_distance + 1 is filled, and the
+    scan stops as soon as a whole row is over the bound, so rejecting a
+    distant candidate costs a few dozen steps.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    if len(a) > len(b):
+        a, b = b, a
+
+    over = max_distance + 1
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        low, high = max(1, i - max_distance), min(len(b), i + max_distance)
+        current = [over] * (len(b) + 1)
+        current[0] = i if i <= max_distance else over
+        char = a[i - 1]
+        row_min = current[0]
+        for j in range(low, high + 1):
+            cost = previous[j - 1] + (char != b[j - 1])
+            if previous[j] + 1 < cost:
+                cost = previous[j] + 1
+            if current[j - 1] + 1 < cost:
+                cost = current[j - 1] + 1
+            current[j] = cost
+            if cost < row_min:
+                row_min = cost
+        if row_min > max_distance:
+            return None
+        previous = current
+
+    distance = previous[len(b)]
+    return distance if distance <= max_distance else None
+
+class TrigramIndex:
+    """
+    Memory-mapped trigram index over a catalog's normalized names
+
+    Candidates are the rows sharing the most trigrams with the query,
+    scored by Dice coefficient; the best few are re-ranked by bounded
+    edit distance so typos and missing punctuation still land on top.
+    """
+
+    def __init__(self, directory: Path, norm_names: Sequence[bytes]):
+        """
+        Args:
+            directory: Catalog directory containing TRIGRAM_FILES
+            norm_names: Normalized name of each catalog row
+        """
+        self._norm_names = norm_names
+        load = lambda name: np.load(Path(directory) / name, mmap_mode='r')
+        self._keys = load('gram_keys.npy')
+        self._offsets = load('gram_offsets.npy')
+        self._postings = load('gram_postings.npy')
+        self._counts = load('gram_counts.npy')
+
+    def _postings_for(self, grams: np.ndarray) -> List[np.ndarray]:
+        indexes = np.searchsorted(self._keys, grams)
+        found = indexes < len(self._keys)
+        found[found] = self._keys[indexes[found]] == grams[found]
+        return [self._postings[self._offsets[i]:self._offsets[i + 1]] for i in indexes[found].tolist()]
+
+    def search(
+        self,
+        norm_query: bytes,
+        limit: int = 10,
+        rerank: int = 24
+    ) -> List[Tuple[int, float]]:
+        """
+        Rows most similar to a normalized query
+
+        Only rows sharing at least MIN_SHARED of the query's trigrams are
+        considered. Any such row must contain one of the rarest grams, so
+        candidates come from those short postings alone; the common grams
+        are checked by binary search instead of being expanded, dropping
+        candidates as soon as they can no longer qualify.
+
+        Args:
+            norm_query: Query passed through normalize_name and encoded
+            limit: Results to return
+            rerank: Trigram candidates re-ranked by edit distance
+
+        Returns:
+            (row, score) pairs, best first, with scores in [0, 1]
+        """
+        grams = trigram_codes(norm_query)
+        postings = sorted(self._postings_for(grams), key=len)
+        if not postings:
+            return []
+
+        min_shared = max(1, math.ceil(len(grams) * MIN_SHARED))
+        probes = len(postings) - min_shared + 1
+        if probes <= 0:
+            return []
+
+        candidates, shared = np.unique(np.concatenate(postings[:probes]), return_counts=True)
+        for remaining, posting in zip(range(len(postings) - probes - 1, -1, -1), postings[probes:]):
+            positions = np.searchsorted(posting, candidates)
+            positions[positions == len(posting)] = 0
+            shared += posting[positions] == candidates
+            # Drop rows that can no longer reach min_shared
+            keep = shared + remaining >= min_shared
+            candidates, shared = candidates[keep], shared[keep]
+
+        dice = 2.0 * shared / (len(grams) + self._counts[candidates])
+        if len(candidates) > rerank:
+            top = np.argpartition(dice, -rerank)[-rerank:]
+            candidates, dice = candidates[top], dice[top]
+
+        return self._rerank(norm_query, candidates, dice, limit)
+
+    def _rerank(
+        self,
+        norm_query: bytes,
+        candidates: np.ndarray,
+        dice: np.ndarray,
+        limit: int
+    ) -> List[Tuple[int, float]]:
+        # Allow roughly one edit per four characters
+        max_distance = max(1, len(norm_query) // 4)
+        scored = []
+        for row, trigram_score in zip(candidates.tolist(), dice.tolist()):
+            name = self._norm_names[row]
+            distance = bounded_levenshtein(norm_query, name, max_distance)
+            edit_score = 0.0 if distance is None else 1.0 - distance / max(len(norm_query), len(name))
+            scored.append((row, round((trigram_score + edit_score) / 2, 4)))
+
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:limit]
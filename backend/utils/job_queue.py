@@ -0,0 +1,141 @@
+import threading
+import time
+import uuid
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class QueueFullError(Exception):
+    """Raised when the job queue is at its maximum depth"""
+
+@dataclass
+class Job:
+    """A unit of background work and its outcome"""
+    id: str
+    kind: str
+    params: Dict[str, Any]
+    status: str = 'queued'  # 'queued', 'running', 'succeeded' or 'failed'
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+    error_type: Optional[str] = None  # Class name of the exception a failed job raised
+
+    @property
+    def done(self) -> bool:
+        return self.status in ('succeeded', 'failed')
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Job status and timing, without the result payload"""
+        now = time.time()
+        queued_until = self.started_at or now
+        return {
+            'job_id': self.id,
+            'type': self.kind,
+            'params': self.params,
+            'status': self.status,
+            'error': self.error,
+            'error_type': self.error_type,
+            'timing': {
+                'submitted_at': self.submitted_at,
+                'started_at': self.started_at,
+                'finished_at': self.finished_at,
+                'queued_seconds': round(queued_until - self.submitted_at, 3),
+                'run_seconds': round((self.finished_at or now) - self.started_at, 3) if self.started_at else None
+            }
+        }
+
+class JobQueue:
+    """Bounded in-process job queue backed by a thread pool"""
+
+    def __init__(self, max_workers: int = 2, max_depth: int = 20, retain: int = 200, name: str = 'job'):
+        """
+        Args:
+            max_workers: Jobs run concurrently
+            max_depth: Maximum queued + running jobs before submit is refused
+            retain: Finished jobs kept for status/result lookups
+            name: Prefix of the worker thread names
+        """
+        self.max_workers = max_workers
+        self.max_depth = max_depth
+        self.retain = retain
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f'{name}-worker')
+        self._jobs: 'OrderedDict[str, Job]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._total_run_seconds = 0.0
+
+    def submit(self, kind: str, params: Dict[str, Any], fn: Callable[..., Any]) -> Job:
+        """
+        Queue fn(**params) to run in the background
+
+        Raises:
+            QueueFullError: If max_depth jobs are already queued or running
+        """
+        with self._lock:
+            active = sum(1 for job in self._jobs.values() if not job.done)
+            if active >= self.max_depth:
+                self._rejected += 1
+                raise QueueFullError(f"Job queue is full ({active}/{self.max_depth})")
+
+            job = Job(id=uuid.uuid4().hex, kind=kind, params=params)
+            self._jobs[job.id] = job
+            self._prune()
+
+        self._executor.submit(self._run, job, fn)
+        logger.info(f"Queued {kind} job {job.id}")
+        return job
+
+    def _run(self, job: Job, fn: Callable[..., Any]):
+        job.started_at = time.time()
+        job.status = 'running'
+        try:
+            job.result = fn(**job.params)
+            job.status = 'succeeded'
+        except Exception as e:
+            logger.error(f"{job.kind} job {job.id} failed: {e}")
+            job.error = str(e)
+            job.error_type = type(e).__name__
+            job.status = 'failed'
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                self._total_run_seconds += job.finished_at - job.started_at
+                if job.status == 'succeeded':
+                    self._completed += 1
+                else:
+                    self._failed += 1
+
+    def _prune(self):
+        """Drop the oldest finished jobs beyond the retention limit (lock held)"""
+        finished = [job_id for job_id, job in self._jobs.items() if job.done]
+        for job_id in finished[:max(0, len(finished) - self.retain)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and throughput counters for metrics"""
+        with self._lock:
+            queued = sum(1 for job in self._jobs.values() if job.status == 'queued')
+            running = sum(1 for job in self._jobs.values() if job.status == 'running')
+            finished = self._completed + self._failed
+            return {
+                'queued': queued,
+                'running': running,
+                'max_depth': self.max_depth,
+                'workers': self.max_workers,
+                'succeeded': self._completed,
+                'failed': self._failed,
+                'rejected': self._rejected,
+                'avg_run_seconds': round(self._total_run_seconds / finished, 3) if finished else None
+            }
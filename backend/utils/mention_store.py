@@ -0,0 +1,180 @@
+import sqlite3
+import sys
+import threading
+import logging
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import List, Optional, Tuple, Iterable
+
+from scrapers.models import RedditMention, MentionBatch
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS mentions (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    subreddit TEXT NOT NULL,
+    author TEXT NOT NULL,
+    created_utc REAL NOT NULL,
+    score INTEGER NOT NULL,
+    num_comments INTEGER NOT NULL,
+    url TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS game_mentions (
+    game TEXT NOT NULL,
+    mention_id TEXT NOT NULL REFERENCES mentions(id),
+    created_utc REAL NOT NULL,
+    PRIMARY KEY (game, mention_id)
+);
+CREATE INDEX IF NOT EXISTS idx_game_mentions_created ON game_mentions (game, created_utc);
+CREATE TABLE IF NOT EXISTS high_water_marks (
+    game TEXT NOT NULL,
+    subreddit TEXT NOT NULL,
+    query TEXT NOT NULL,
+    newest_utc REAL,
+    covered_from_utc REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (game, subreddit, query)
+);
+"""
+
+def normalize_game_key(game_name: str) -> str:
+    """Key used to group stored mentions by game"""
+    return " ".join(game_name.lower().split())
+
+class MentionStore:
+    """SQLite store of Reddit mentions with per-search high-water marks"""
+
+    def __init__(self, db_path: Path):
+        """
+        Args:
+            db_path: SQLite database file (created if missing)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+
+    def get_high_water_mark(self, game_name: str, subreddit: str, query: str) -> Optional[Tuple[Optional[float], float]]:
+        """
+        Get what is already stored for one subreddit/query search
+
+        Returns:
+            Tuple of (newest created_utc seen, earliest created_utc fully
+            covered) as epoch seconds, or None if never collected
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT newest_utc, covered_from_utc FROM high_water_marks "
+                "WHERE game = ? AND subreddit = ? AND query = ?",
+                (normalize_game_key(game_name), subreddit, query)
+            ).fetchone()
+        return row
+
+    def set_high_water_mark(
+        self,
+        game_name: str,
+        subreddit: str,
+        query: str,
+        newest_utc: Optional[float],
+        covered_from_utc: float
+    ):
+        """
+        Record the newest post and earliest covered time for one search
+
+        Coverage that reaches the stored newest post extends the stored
+        range. Coverage that stops short of it leaves a gap, so it replaces
+        the stored range rather than claiming the gap was searched.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO high_water_marks (game, subreddit, query, newest_utc, covered_from_utc, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (game, subreddit, query) DO UPDATE SET
+                    newest_utc = MAX(COALESCE(excluded.newest_utc, 0), COALESCE(newest_utc, 0)),
+                    covered_from_utc = CASE
+                        WHEN excluded.covered_from_utc <= COALESCE(newest_utc, updated_at)
+                        THEN MIN(excluded.covered_from_utc, covered_from_utc)
+                        ELSE excluded.covered_from_utc
+                    END,
+                    updated_at = excluded.updated_at
+                """,
+                (normalize_game_key(game_name), subreddit, query, newest_utc, covered_from_utc,
+                 datetime.now(UTC).timestamp())
+            )
+
+    def add_mentions(self, game_name: str, mentions: Iterable[RedditMention]) -> int:
+        """
+        Insert or refresh mentions and link them to a game
+
+        Re-seen posts get their score and comment count updated.
+
+        Returns:
+            Number of mentions written
+        """
+        game = normalize_game_key(game_name)
+        rows = [
+            (m.id, m.title, m.subreddit, m.author, m.created_utc.timestamp(), m.score, m.num_comments, m.url)
+            for m in mentions
+        ]
+        if not rows:
+            return 0
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO mentions (id, title, subreddit, author, created_utc, score, num_comments, url)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (id) DO UPDATE SET
+                    score = excluded.score,
+                    num_comments = excluded.num_comments
+                """,
+                rows
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO game_mentions (game, mention_id, created_utc) VALUES (?, ?, ?)",
+                [(game, row[0], row[4]) for row in rows]
+            )
+        return len(rows)
+
+    def _mention_rows(self, game_name: str, since: datetime) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(
+                """
+                SELECT m.id, m.title, m.subreddit, m.author, m.created_utc, m.score, m.num_comments, m.url
+                FROM game_mentions g JOIN mentions m ON m.id = g.mention_id
+                WHERE g.game = ? AND g.created_utc >= ?
+                ORDER BY g.created_utc DESC
+                """,
+                (normalize_game_key(game_name), since.timestamp())
+            ).fetchall()
+
+    def get_mentions(self, game_name: str, since: datetime) -> List[RedditMention]:
+        """Stored mentions of a game created at or after `since`, newest first"""
+        return [
+            RedditMention(
+                id=row[0],
+                title=row[1],
+                subreddit=sys.intern(row[2]),
+                author=sys.intern(row[3]),
+                created_utc=datetime.fromtimestamp(row[4], UTC),
+                score=row[5],
+                num_comments=row[6],
+                url=row[7]
+            )
+            for row in self._mention_rows(game_name, since)
+        ]
+
+    def get_mention_batch(self, game_name: str, since: datetime) -> MentionBatch:
+        """Like get_mentions, but packed straight into columns without per-row objects"""
+        return MentionBatch.from_rows(self._mention_rows(game_name, since))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
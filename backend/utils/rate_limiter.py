@@ -0,0 +1,205 @@
+import math
+import threading
+import time
+import logging
+from typing import Dict, Any, Mapping, Optional
+from urllib.parse import urlparse
+
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+class TokenBucket:
+    """Thread-safe token bucket that adapts to the limits a server reports"""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: Tokens added per second (math.inf for no limit)
+            capacity: Maximum burst size
+        """
+        self.rate = rate
+        self.base_rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.blocked_until = 0.0
+        self.server_remaining: Optional[float] = None
+        self.server_reset_at: Optional[float] = None
+        self.acquired = 0
+        self.waited_seconds = 0.0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        self._updated = now
+        if math.isinf(self.rate):
+            # Unlimited: always full (0 * inf would be nan)
+            self.tokens = self.capacity
+        else:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+
+    def acquire(self):
+        """Take one token, sleeping only if the bucket is empty or the host asked us to back off"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now < self.blocked_until:
+                    wait = self.blocked_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    self.acquired += 1
+                    return
+                else:
+                    wait = (1 - self.tokens) / self.rate
+
+                self.waited_seconds += wait
+
+            time.sleep(wait)
+
+    def update_budget(self, remaining: float, reset_seconds: float):
+        """
+        Adapt to a server-reported budget (e.g. Reddit's X-Ratelimit headers)
+
+        Args:
+            remaining: Requests left in the current window
+            reset_seconds: Seconds until the window resets
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.server_remaining = remaining
+            self.server_reset_at = now + reset_seconds
+
+            if remaining <= 0:
+                # Window exhausted: nothing until it resets, then one token
+                self.tokens = min(self.tokens, 1 - reset_seconds * self.rate)
+                self.blocked_until = max(self.blocked_until, self.server_reset_at)
+                return
+
+            # Never hold more tokens than the server says are left, and spread
+            # the remainder over the rest of the window (but never slower than
+            # the configured rate while plenty of budget is left)
+            self.tokens = min(self.tokens, remaining)
+            window_rate = remaining / reset_seconds if reset_seconds > 0 else self.base_rate
+            self.rate = max(window_rate, self.base_rate) if remaining > self.capacity else window_rate
+
+    def back_off(self, seconds: float):
+        """Block the bucket for a server-requested delay (e.g. Retry-After)"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            # Empty, refilling to exactly one token by the time the block ends
+            self.tokens = min(self.tokens, 1 - seconds * self.rate)
+            self.blocked_until = max(self.blocked_until, now + seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current budget as plain values for metrics"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                'tokens': round(max(0.0, self.tokens), 2),
+                'capacity': self.capacity,
+                'rate_per_second': None if math.isinf(self.rate) else round(self.rate, 3),
+                'blocked_for': round(max(0.0, self.blocked_until - now), 2),
+                'server_remaining': self.server_remaining,
+                'server_reset_in': round(max(0.0, self.server_reset_at - now), 2) if self.server_reset_at else None,
+                'acquired': self.acquired,
+                'waited_seconds': round(self.waited_seconds, 2)
+            }
+
+class RateLimiter:
+    """Registry of per-host token buckets shared by all scrapers"""
+
+    def __init__(self, default_rate: float = 1.0, default_capacity: float = 1.0):
+        self.default_rate = default_rate
+        self.default_capacity = default_capacity
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _host(url_or_host: str) -> str:
+        return urlparse(url_or_host).netloc or url_or_host
+
+    def configure(self, url_or_host: str, rate: float, capacity: float) -> TokenBucket:
+        """
+        Set the baseline rate and burst size for a host
+
+        Reconfiguring with the same baseline keeps the rate the bucket has
+        adapted to from server headers.
+        """
+        host = self._host(url_or_host)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(rate, capacity)
+            else:
+                if rate != bucket.base_rate:
+                    bucket.rate = bucket.base_rate = rate
+                bucket.capacity = capacity
+        return bucket
+
+    def bucket(self, url_or_host: str) -> TokenBucket:
+        """Get the bucket for a host, creating one with default limits"""
+        host = self._host(url_or_host)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.default_rate, self.default_capacity)
+            return bucket
+
+    def acquire(self, url: str):
+        """Wait for permission to send one request to the URL's host"""
+        self.bucket(url).acquire()
+
+    def update_from_headers(self, url: str, headers: Mapping[str, str]):
+        """
+        Feed rate limit headers from a response back into the host's bucket
+
+        Understands Reddit's X-Ratelimit-Remaining/X-Ratelimit-Reset and the
+        standard Retry-After header (seconds form).
+        """
+        bucket = self.bucket(url)
+
+        retry_after = headers.get('retry-after')
+        if retry_after:
+            try:
+                seconds = float(retry_after)
+            except ValueError:
+                seconds = None
+            if seconds is not None:
+                logger.warning(f"{self._host(url)} asked us to retry after {seconds:.0f}s")
+                bucket.back_off(seconds)
+
+        remaining = headers.get('x-ratelimit-remaining')
+        reset = headers.get('x-ratelimit-reset')
+        if remaining is not None and reset is not None:
+            try:
+                bucket.update_budget(float(remaining), float(reset))
+            except ValueError:
+                logger.debug(f"Ignoring malformed rate limit headers from {self._host(url)}")
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Budget of every known host, keyed by host name"""
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {host: bucket.snapshot() for host, bucket in buckets.items()}
+
+# Shared instance used by every scraper in the process
+rate_limiter = RateLimiter()
+
+class RateLimitedAdapter(HTTPAdapter):
+    """requests transport adapter that sends every request through the shared limiter"""
+
+    def __init__(self, limiter: RateLimiter = rate_limiter, **kwargs):
+        self.limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self.limiter.acquire(request.url)
+        response = super().send(request, **kwargs)
+        self.limiter.update_from_headers(request.url, response.headers)
+        return response
@@ -0,0 +1,226 @@
+import logging
+import threading
+import time
+import uuid
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+_DICTIONARY = pa.dictionary(pa.int32(), pa.string())
+
+# Stored columns of each source (app_id and month live in the partition path)
+SCHEMAS: Dict[str, pa.Schema] = {
+    'steam': pa.schema([
+        ('game_name', _DICTIONARY),
+        ('date', pa.timestamp('s')),
+        ('follower_count', pa.int64()),
+        ('source', _DICTIONARY),
+    ]),
+    'reddit': pa.schema([
+        ('id', pa.string()),
+        ('title', pa.string()),
+        ('subreddit', _DICTIONARY),
+        ('author', _DICTIONARY),
+        ('created_utc', pa.timestamp('s', tz='UTC')),
+        ('date', pa.timestamp('s')),
+        ('score', pa.int64()),
+        ('num_comments', pa.int64()),
+        ('url', pa.string()),
+    ]),
+}
+
+# Columns identifying a row; when a partition is compacted the latest write wins
+KEYS: Dict[str, List[str]] = {
+    'steam': ['date', 'source'],
+    'reddit': ['id'],
+}
+
+PARTITIONING = ds.partitioning(pa.schema([('app_id', pa.string()), ('month', pa.string())]), flavor='hive')
+
+# Part files a partition collects before it is compacted into one
+COMPACT_AFTER = 8
+
+DateLike = Union[date, datetime, str]
+
+def _timestamp(value: DateLike) -> pa.Scalar:
+    return pa.scalar(np.datetime64(value, 's'), type=pa.timestamp('s'))
+
+def _month(value: DateLike) -> str:
+    return str(np.datetime64(value, 'M'))
+
+def _latest(table: pa.Table, keys: List[str]) -> pa.Table:
+    """Last row of table for each key, ordered by date"""
+    rows = table.append_column('_row', pa.array(np.arange(len(table))))
+    latest = rows.group_by(keys, use_threads=False).aggregate([('_row', 'max')])
+    return table.take(latest['_row_max']).sort_by('date')
+
+class RawDataLake:
+    """
+    Parquet store of raw Steam and Reddit rows
+
+    Rows live under <root>/<source>/app_id=<id>/month=<YYYY-MM>/ as part
+    files. Every append writes one new part per month touched and a
+    partition is compacted into a single deduplicated file once it has
+    COMPACT_AFTER parts. Low-cardinality strings are dictionary-encoded,
+    and reads prune partitions by app_id/month before filtering row
+    groups on date.
+    """
+
+    def __init__(self, root: Path):
+        """
+        Args:
+            root: Lake directory (created if missing)
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def append(self, source: str, app_id: str, frame: pd.DataFrame) -> int:
+        """
+        Append raw rows for one app
+
+        Args:
+            source: 'steam' or 'reddit'
+            app_id: Steam App ID the rows belong to
+            frame: Rows as built by aggregation.follower_data_to_dataframe
+                or aggregation.mentions_to_dataframe
+
+        Returns:
+            Number of rows written
+        """
+        if frame.empty:
+            return 0
+
+        schema = SCHEMAS[source]
+        frame = frame.sort_values('date', kind='stable')
+        table = pa.Table.from_pandas(frame[schema.names], schema=schema, preserve_index=False, safe=False)
+
+        # Rows are sorted by date, so each month is one contiguous slice
+        months = frame['date'].to_numpy().astype('datetime64[M]')
+        bounds = np.flatnonzero(np.append(True, months[1:] != months[:-1]))
+        ends = np.append(bounds[1:], len(months))
+
+        with self._lock:
+            for start, end in zip(bounds.tolist(), ends.tolist()):
+                directory = self.root / source / f"app_id={app_id}" / f"month={months[start]}"
+                directory.mkdir(parents=True, exist_ok=True)
+                self._write(directory, table.slice(start, end - start))
+                if len(list(directory.glob('part-*.parquet'))) >= COMPACT_AFTER:
+                    self._compact(source, directory)
+
+        return len(frame)
+
+    def read(
+        self,
+        source: str,
+        app_ids: Optional[Sequence[str]] = None,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        columns: Optional[Sequence[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Read raw rows, touching only the partitions that can match
+
+        Parts are scanned in write order, so rows appended more than once
+        since the last compaction come back once, as last written.
+
+        Args:
+            source: 'steam' or 'reddit'
+            app_ids: Apps to read (default: all)
+            start: First day to include
+            end: Last day to include
+            columns: Columns to load (default: all, plus app_id and month)
+
+        Returns:
+            DataFrame of matching rows, or an empty frame if there are none
+        """
+        directory = self.root / source
+        schema = SCHEMAS[source]
+        if not directory.exists():
+            return schema.empty_table().to_pandas()
+
+        dataset = ds.dataset(
+            directory,
+            schema=pa.unify_schemas([schema, PARTITIONING.schema]),
+            format='parquet',
+            partitioning=PARTITIONING
+        )
+
+        conditions = []
+        if app_ids is not None:
+            conditions.append(ds.field('app_id').isin([str(app_id) for app_id in app_ids]))
+        if start is not None:
+            conditions.append(ds.field('month') >= _month(start))
+            conditions.append(ds.field('date') >= _timestamp(np.datetime64(start, 'D')))
+        if end is not None:
+            conditions.append(ds.field('month') <= _month(end))
+            conditions.append(ds.field('date') < _timestamp(np.datetime64(end, 'D') + 1))
+
+        condition = None
+        for part in conditions:
+            condition = part if condition is None else condition & part
+
+        keys = ['app_id', *KEYS[source]]
+        names = list(columns) if columns else dataset.schema.names
+        with self._lock:
+            table = dataset.to_table(
+                columns=names + [key for key in keys if key not in names],
+                filter=condition,
+                use_threads=False
+            )
+        return _latest(table, keys).select(names).to_pandas()
+
+    def compact(self, source: Optional[str] = None) -> int:
+        """
+        Compact every partition holding more than one part file
+
+        Returns:
+            Number of partitions compacted
+        """
+        compacted = 0
+        with self._lock:
+            for name in [source] if source else SCHEMAS:
+                for directory in sorted((self.root / name).glob('app_id=*/month=*')):
+                    if len(list(directory.glob('part-*.parquet'))) > 1:
+                        self._compact(name, directory)
+                        compacted += 1
+        return compacted
+
+    def _write(self, directory: Path, table: pa.Table) -> Path:
+        # Part names sort in write order; the dot-prefixed temp file is
+        # skipped by dataset discovery until it is renamed into place
+        name = f"part-{time.time_ns():020d}-{uuid.uuid4().hex[:8]}.parquet"
+        temp = directory / f".{name}.tmp"
+        pq.write_table(table, temp, compression='zstd')
+        return temp.rename(directory / name)
+
+    def _compact(self, source: str, directory: Path):
+        parts = sorted(directory.glob('part-*.parquet'))
+        table = pa.concat_tables([pq.read_table(part, schema=SCHEMAS[source]) for part in parts])
+
+        table = _latest(table, KEYS[source])
+
+        self._write(directory, table)
+        for part in parts:
+            part.unlink()
+        logger.info(f"Compacted {len(parts)} parts into {len(table)} rows in {directory}")
+
+if __name__ == '__main__':
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Compact the raw data lake's partitions")
+    parser.add_argument('root', help="Lake directory, e.g. data/raw")
+    parser.add_argument('--source', choices=sorted(SCHEMAS))
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+    print(f"{RawDataLake(Path(args.root)).compact(args.source)} partitions compacted")
@@ -0,0 +1,31 @@
+import hashlib
+
+from utils.app_catalog import normalize_name
+
+# Process-independent IDs and seeds for simulated data. Python's hash() of
+# a str changes with every interpreter (PYTHONHASHSEED), so anything keyed
+# by it differs between gunicorn workers and restarts; blake2b doesn't.
+
+# Simulated app IDs live above real Steam IDs (a few million) so they
+# never collide with a real app in the stores or caches
+SIMULATED_APP_ID_BASE = 1_000_000_000
+SIMULATED_APP_ID_RANGE = 1_000_000_000
+
+def stable_hash(*parts: object) -> int:
+    """64-bit blake2b hash of the parts, identical in every process"""
+    key = '\x1f'.join(str(part) for part in parts).encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'big')
+
+def simulated_app_id(game_name: str) -> str:
+    """
+    App ID for a game SteamDB couldn't find
+
+    Names are normalized first, so "Baldur's Gate 3" and "baldurs gate 3"
+    get the same ID.
+    """
+    key = normalize_name(game_name) or game_name.strip()
+    return str(SIMULATED_APP_ID_BASE + stable_hash('app_id', key) % SIMULATED_APP_ID_RANGE)
+
+def app_seed(app_id: str) -> int:
+    """Seed for an app's simulated data"""
+    return stable_hash('seed', app_id)
@@ -32,10 +32,21 @@ interface Stats {
   correlation: number | null;
 }
 
+interface StageEvent {
+  stage: string;
+  elapsed: number;
+  stage_seconds: number;
+  rows?: number;
+  subreddit?: string;
+  query?: string;
+  query_seconds?: number;
+}
+
 interface AnalysisResult {
   success: boolean;
   game_name: string;
   app_id: string;
+  result_id: string;
   data: GameData[];
   stats: Stats;
   collected: {
@@ -46,12 +57,106 @@ interface AnalysisResult {
 
 const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'http://localhost:5000';
 
+const formatChartData = (data: GameData[]) =>
+  data.map(item => ({
+    date: new Date(item.date).toLocaleDateString(),
+    followers: item.steam_followers_count,
+    mentions: item.mentions_in_social_media,
+    fullDate: item.date
+  }));
+
+const describeStage = (event: StageEvent) => {
+  if (event.stage === 'search_game_mentions') {
+    return `Reddit r/${event.subreddit} for ${event.query}: ${event.rows} posts in ${event.query_seconds}s`;
+  }
+  if (event.stage === 'search_game_by_name') {
+    return `Found game on Steam in ${event.stage_seconds}s`;
+  }
+  if (event.stage === 'get_follower_history') {
+    return `Steam follower history: ${event.rows} days in ${event.stage_seconds}s`;
+  }
+  return `Merged ${event.rows} days in ${event.stage_seconds}s`;
+};
+
+function FollowersMentionsChart({ data }: { data: GameData[] }) {
+  return (
+    <ResponsiveContainer width="100%" height="100%">
+      <LineChart data={formatChartData(data)}>
+        <CartesianGrid strokeDasharray="3 3" />
+        <XAxis 
+          dataKey="date" 
+          tick={{ fontSize: 12 }}
+          angle={-45}
+          textAnchor="end"
+          height={60}
+        />
+        <YAxis yAxisId="followers" orientation="left" />
+        <YAxis yAxisId="mentions" orientation="right" />
+        <Tooltip 
+          labelFormatter={(label: string) => `Date: ${label}`}
+          formatter={(value: number, name: string) => [
+            name === 'followers' ? value.toLocaleString() : value,
+            name === 'followers' ? 'Steam Followers' : 'Reddit Mentions'
+          ]}
+        />
+        <Legend />
+        <Line
+          yAxisId="followers"
+          type="monotone"
+          dataKey="followers"
+          stroke="#2563eb"
+          strokeWidth={2}
+          dot={{ r: 4 }}
+          name="Steam Followers"
+        />
+        <Line
+          yAxisId="mentions"
+          type="monotone"
+          dataKey="mentions"
+          stroke="#ea580c"
+          strokeWidth={2}
+          dot={{ r: 4 }}
+          name="Reddit Mentions"
+        />
+      </LineChart>
+    </ResponsiveContainer>
+  );
+}
+
 function App() {
   const [gameName, setGameName] = useState('');
   const [days, setDays] = useState(30);
   const [loading, setLoading] = useState(false);
   const [result, setResult] = useState<AnalysisResult | null>(null);
   const [error, setError] = useState('');
+  const [stages, setStages] = useState<StageEvent[]>([]);
+  const [partialData, setPartialData] = useState<GameData[]>([]);
+
+  // Stream collection progress over Server-Sent Events so the chart fills in
+  // as Steam and each Reddit search finish
+  const streamAnalysis = (name: string) =>
+    new Promise<AnalysisResult>((resolve, reject) => {
+      const params = new URLSearchParams({ game_name: name, days: String(days) });
+      const source = new EventSource(`${API_BASE_URL}/api/collect-data/stream?${params}`);
+
+      source.addEventListener('stage', (event) => {
+        const stage: StageEvent = JSON.parse((event as MessageEvent).data);
+        setStages(prev => [...prev, stage]);
+      });
+      source.addEventListener('rows', (event) => {
+        setPartialData(JSON.parse((event as MessageEvent).data).data);
+      });
+      source.addEventListener('complete', (event) => {
+        source.close();
+        resolve(JSON.parse((event as MessageEvent).data));
+      });
+      source.addEventListener('error', (event) => {
+        source.close();
+        // Server-sent error events carry a body; connection errors don't
+        const body = (event as MessageEvent).data;
+        reject(new Error(body ? JSON.parse(body).error : 'Failed to analyze game data'));
+      });
+    });
 
   const handleAnalyze = async () => {
     if (!gameName.trim()) {
@@ -62,17 +167,25 @@ function App() {
     setLoading(true);
     setError('');
     setResult(null);
+    setStages([]);
+    setPartialData([]);
 
     try {
-      const response = await axios.post(`${API_BASE_URL}/api/collect-data`, {
-        game_name: gameName.trim(),
-        days: days
-      });
+      if (typeof EventSource !== 'undefined') {
+        setResult(await streamAnalysis(gameName.trim()));
+      } else {
+        const response = await axios.post(`${API_BASE_URL}/api/collect-data`, {
+          game_name: gameName.trim(),
+          days: days
+        });
 
-      setResult(response.data);
+        setResult(response.data);
+      }
     } catch (err: unknown) {
       if (axios.isAxiosError(err)) {
         setError(err.response?.data?.error || 'Failed to analyze game data');
+      } else if (err instanceof Error) {
+        setError(err.message);
       } else {
         setError('Failed to analyze game data');
       }
@@ -82,38 +195,30 @@ function App() {
   };
 
   const handleExportCSV = async () => {
-    if (!result?.data) return;
+    if (!result?.result_id) return;
 
+    // The backend exports its stored copy of the result, so nothing is
+    // uploaded; asking for the file first surfaces an expired result
+    // here instead of navigating to an error page
+    const filename = `${result.game_name.toLowerCase().replace(/\s+/g, '_')}_analysis.csv`;
     try {
       const response = await axios.post(`${API_BASE_URL}/api/export-csv`, {
-        data: result.data,
-        filename: `${result.game_name.toLowerCase().replace(/\s+/g, '_')}_analysis.csv`
+        result_id: result.result_id,
+        filename
       });
 
-      if (response.data.download_url) {
-        const link = document.createElement('a');
-        link.href = `${API_BASE_URL}${response.data.download_url}`;
-        link.download = `${result.game_name}_analysis.csv`;
-        document.body.appendChild(link);
-        link.click();
-        document.body.removeChild(link);
-      }
+      const link = document.createElement('a');
+      link.href = `${API_BASE_URL}${response.data.download_url}`;
+      link.download = filename;
+      document.body.appendChild(link);
+      link.click();
+      document.body.removeChild(link);
     } catch (err) {
       console.error('Export failed:', err);
+      setError((axios.isAxiosError(err) && err.response?.data?.error) || 'Export failed');
     }
   };
 
-  const formatChartData = () => {
-    if (!result?.data) return [];
-    
-    return result.data.map(item => ({
-      date: new Date(item.date).toLocaleDateString(),
-      followers: item.steam_followers_count,
-      mentions: item.mentions_in_social_media,
-      fullDate: item.date
-    }));
-  };
-
   return (
     <div className="min-h-screen bg-gradient-to-br from-blue-50 to-indigo-100">
       <div className="container mx-auto px-4 py-8">
@@ -184,6 +289,26 @@ function App() {
           </div>
         </div>
 
+        {/* Live Progress */}
+        {loading && (stages.length > 0 || partialData.length > 0) && (
+          <div className="bg-white rounded-lg shadow-lg p-6 mb-8">
+            <h2 className="text-lg font-semibold text-gray-800 mb-4">Collecting data...</h2>
+            <ul className="text-sm text-gray-600 space-y-1 mb-6 max-h-40 overflow-y-auto">
+              {stages.map((stage, index) => (
+                <li key={index}>
+                  <span className="text-gray-400 mr-2">{stage.elapsed.toFixed(1)}s</span>
+                  {describeStage(stage)}
+                </li>
+              ))}
+            </ul>
+            {partialData.length > 0 && (
+              <div className="h-72">
+                <FollowersMentionsChart data={partialData} />
+              </div>
+            )}
+          </div>
+        )}
+
         {/* Error Display */}
         {error && (
           <div className="bg-red-50 border border-red-200 rounded-lg p-4 mb-8 max-w-2xl mx-auto">
@@ -264,46 +389,7 @@ function App() {
               </div>
 
               <div className="h-96 mb-8">
-                <ResponsiveContainer width="100%" height="100%">
-                  <LineChart data={formatChartData()}>
-                    <CartesianGrid strokeDasharray="3 3" />
-                    <XAxis 
-                      dataKey="date" 
-                      tick={{ fontSize: 12 }}
-                      angle={-45}
-                      textAnchor="end"
-                      height={60}
-                    />
-                    <YAxis yAxisId="followers" orientation="left" />
-                    <YAxis yAxisId="mentions" orientation="right" />
-                    <Tooltip 
-                      labelFormatter={(label: string) => `Date: ${label}`}
-                      formatter={(value: number, name: string) => [
-                        name === 'followers' ? value.toLocaleString() : value,
-                        name === 'followers' ? 'Steam Followers' : 'Reddit Mentions'
-                      ]}
-                    />
-                    <Legend />
-                    <Line
-                      yAxisId="followers"
-                      type="monotone"
-                      dataKey="followers"
-                      stroke="#2563eb"
-                      strokeWidth={2}
-                      dot={{ r: 4 }}
-                      name="Steam Followers"
-                    />
-                    <Line
-                      yAxisId="mentions"
-                      type="monotone"
-                      dataKey="mentions"
-                      stroke="#ea580c"
-                      strokeWidth={2}
-                      dot={{ r: 4 }}
-                      name="Reddit Mentions"
-                    />
-                  </LineChart>
-                </ResponsiveContainer>
+                <FollowersMentionsChart data={result.data} />
               </div>
 
               {/* Data Table */}